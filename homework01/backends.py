@@ -0,0 +1,475 @@
+"""
+Бэкенды запросов для задач 1, 4, 5, 6, 8 и 9.
+
+Кроме pandas задачи можно выполнять ленивыми многопоточными запросами прямо
+по CSV или Parquet, не загружая датасет в память целиком:
+ - duckdb — встроенный SQL-движок DuckDB
+ - polars — ленивый API Polars (scan_csv/scan_parquet)
+DuckDB и Polars необязательны: без них доступен только бэкенд pandas.
+
+Движок считает только небольшие сводки и нужные строки, а итоговые кортежи
+собираются теми же функциями cs102_pandas, поэтому результаты имеют те же типы.
+Порядок строк исходного файла передается столбцом _row (номер строки),
+он же становится индексом возвращаемых таблиц, как у датасета из pd.read_csv.
+При равенстве частот побеждает значение, встретившееся в файле раньше.
+
+Пример:
+    backend = get_backend("duckdb")
+    num_students, num_groups, fsuir = backend.filter_fsuir_students("isu_fake_data.csv")
+"""
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+import cs102_pandas
+from cs102_pandas import FSUIR
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+Source = Union[str, Path, pd.DataFrame]
+
+NAME_PATTERN = r"^\s*\S+\s+(\S+)"
+COLUMNS_9 = ["фио", "ису", "факультет", "курс", "группа"]
+
+
+def _is_parquet(source: Source) -> bool:
+    return Path(source).suffix.lower() in (".parquet", ".pq")
+
+
+def _polars_frame(data: pd.DataFrame) -> "pl.DataFrame":
+    try:
+        return pl.from_pandas(data)
+    except ImportError:
+        # без pyarrow Polars принимает только столбцы на массивах NumPy
+        categorical = data.select_dtypes("category").columns
+        return pl.from_pandas(data.astype({column: object for column in categorical}))
+
+
+def _with_row_index(data: pd.DataFrame) -> pd.DataFrame:
+    data = data.set_index("_row")
+    data.index = data.index.astype(np.int64)
+    data.index.name = None
+    return data
+
+
+class Backend(ABC):
+    """
+    Задачи 1, 4, 5, 6, 8 и 9 по источнику: пути к CSV или Parquet либо таблице pandas.
+    Результаты совпадают с функциями cs102_pandas по датасету из этого источника.
+    """
+
+    name = "base"
+
+    @abstractmethod
+    def filter_fsuir_students(
+        self, source: Source, faculty: str = FSUIR
+    ) -> Tuple[int, int, pd.DataFrame]:
+        ...
+
+    @abstractmethod
+    def faculty_statistics(self, source: Source):
+        ...
+
+    @abstractmethod
+    def course_statistics(self, source: Source) -> Tuple[pd.Series, pd.Series]:
+        ...
+
+    @abstractmethod
+    def most_popular_name(self, source: Source) -> Tuple[str, str, str, str, float]:
+        ...
+
+    @abstractmethod
+    def highest_avg_grade_faculty(self, source: Source) -> Tuple[str, str, int]:
+        ...
+
+    @abstractmethod
+    def find_consecutive_students(self, source: Source, length: int = 5) -> pd.DataFrame:
+        ...
+
+
+class PandasBackend(Backend):
+    """
+    Читает источник в память и вызывает функции cs102_pandas.
+    """
+
+    name = "pandas"
+
+    def _load(self, source: Source) -> pd.DataFrame:
+        if isinstance(source, pd.DataFrame):
+            return source
+        return pd.read_parquet(source) if _is_parquet(source) else pd.read_csv(source)
+
+    def filter_fsuir_students(self, source: Source, faculty: str = FSUIR):
+        return cs102_pandas.filter_fsuir_students(self._load(source), faculty)
+
+    def faculty_statistics(self, source: Source):
+        return cs102_pandas.faculty_statistics(self._load(source))
+
+    def course_statistics(self, source: Source):
+        return cs102_pandas.course_statistics(self._load(source))
+
+    def most_popular_name(self, source: Source):
+        return cs102_pandas.most_popular_name(self._load(source))
+
+    def highest_avg_grade_faculty(self, source: Source):
+        return cs102_pandas.highest_avg_grade_faculty(self._load(source))
+
+    def find_consecutive_students(self, source: Source, length: int = 5):
+        return cs102_pandas.find_consecutive_students(self._load(source), length)
+
+
+class QueryBackend(Backend):
+    """
+    Общая сборка результатов задач из сводок, которые считает движок.
+    Наследники реализуют абстрактные методы, возвращающие небольшие объекты pandas.
+    """
+
+    @abstractmethod
+    def faculty_rows(self, source: Source, faculty: str) -> pd.DataFrame:
+        ...
+
+    @abstractmethod
+    def faculty_counts(self, source: Source) -> pd.Series:
+        """
+        Число студентов по факультетам в порядке первого появления факультета.
+        """
+
+    @abstractmethod
+    def course_faculty_counts(self, source: Source) -> pd.Series:
+        ...
+
+    @abstractmethod
+    def grade3_faculty_means(self, source: Source) -> pd.Series:
+        """
+        Средний балл третьего курса по факультетам в порядке первого появления.
+        """
+
+    @abstractmethod
+    def grade3_rows(self, source: Source, faculty: str) -> pd.DataFrame:
+        ...
+
+    @abstractmethod
+    def popular_name(self, source: Source) -> Tuple[str, int, int]:
+        """
+        Самое частое имя, его частота и общее число строк.
+        """
+
+    @abstractmethod
+    def name_group(self, source: Source, name: str) -> Tuple[str, str, str]:
+        """
+        Группа, где больше всего студентов с именем name, факультет и курс ее первой строки.
+        """
+
+    @abstractmethod
+    def isu_run_start(self, source: Source, length: int) -> Optional[int]:
+        ...
+
+    @abstractmethod
+    def isu_rows(self, source: Source, first: int, last: int) -> pd.DataFrame:
+        ...
+
+    # Задача 1
+    def filter_fsuir_students(
+        self, source: Source, faculty: str = FSUIR
+    ) -> Tuple[int, int, pd.DataFrame]:
+        data_fsuir = self.faculty_rows(source, faculty)
+        return (data_fsuir.shape[0], len(set(data_fsuir["группа"])), data_fsuir)
+
+    # Задача 4
+    def faculty_statistics(self, source: Source):
+        return cs102_pandas.faculty_statistics(None, self.faculty_counts(source))
+
+    # Задача 5
+    def course_statistics(self, source: Source) -> Tuple[pd.Series, pd.Series]:
+        return cs102_pandas.course_statistics(None, self.course_faculty_counts(source))
+
+    # Задача 6
+    def most_popular_name(self, source: Source) -> Tuple[str, str, str, str, float]:
+        popular_name, count, total = self.popular_name(source)
+        name_group, faculty, course = self.name_group(source, popular_name)
+        return (popular_name, name_group, faculty, course, round(np.int64(count) / total, 2))
+
+    # Задача 8
+    def highest_avg_grade_faculty(self, source: Source) -> Tuple[str, str, int]:
+        faculty_means = self.grade3_faculty_means(source)
+        rows = self.grade3_rows(source, faculty_means.idxmax())
+        return cs102_pandas.highest_avg_grade_faculty(rows, faculty_means)
+
+    # Задача 9
+    def find_consecutive_students(self, source: Source, length: int = 5) -> pd.DataFrame:
+        first = self.isu_run_start(source, length)
+        if first is None:
+            return self.isu_rows(source, 0, -1)
+        return self.isu_rows(source, first, first + length - 1)
+
+
+class DuckDBBackend(QueryBackend):
+    """
+    SQL-запросы DuckDB по файлу. threads ограничивает число потоков,
+    memory_limit (например, "2GB") — память, сверх которой DuckDB пишет на диск.
+    Номер строки CSV берется из row_number() OVER (), который при включенном
+    по умолчанию preserve_insertion_order следует порядку файла.
+    """
+
+    name = "duckdb"
+
+    def __init__(self, threads: Optional[int] = None, memory_limit: Optional[str] = None):
+        if duckdb is None:
+            raise ImportError("для бэкенда duckdb нужен пакет duckdb")
+        self.connection = duckdb.connect()
+        # индикатор выполнения DuckDB пишет в stdout и портит вывод JSON
+        self.connection.execute("SET enable_progress_bar = false")
+        if threads:
+            self.connection.execute(f"SET threads = {int(threads)}")
+        if memory_limit:
+            self.connection.execute("SET memory_limit = ?", [memory_limit])
+
+    def _scan(self, source: Source) -> str:
+        if isinstance(source, pd.DataFrame):
+            self.connection.register("source_frame", source)
+            return "(SELECT *, row_number() OVER () - 1 AS _row FROM source_frame)"
+        path = str(source).replace("'", "''")
+        if _is_parquet(source):
+            return (
+                f"(SELECT * EXCLUDE (file_row_number), file_row_number AS _row "
+                f"FROM read_parquet('{path}', file_row_number = true))"
+            )
+        return (
+            f"(SELECT *, row_number() OVER () - 1 AS _row "
+            f"FROM read_csv('{path}', header = true))"
+        )
+
+    def _query(self, source: Source, sql: str, params: list = ()) -> pd.DataFrame:
+        return self.connection.execute(sql.format(data=self._scan(source)), list(params)).df()
+
+    def faculty_rows(self, source, faculty):
+        sql = "SELECT * FROM {data} WHERE факультет = ? ORDER BY _row"
+        return _with_row_index(self._query(source, sql, [faculty]))
+
+    def faculty_counts(self, source):
+        sql = """
+            SELECT факультет, count(*) AS n FROM {data}
+            GROUP BY факультет ORDER BY min(_row)
+        """
+        counts = self._query(source, sql)
+        return pd.Series(
+            counts["n"].to_numpy(), index=pd.Index(counts["факультет"], name="факультет")
+        )
+
+    def course_faculty_counts(self, source):
+        sql = "SELECT курс, факультет, count(*) AS n FROM {data} GROUP BY ALL ORDER BY ALL"
+        return self._query(source, sql).set_index(["курс", "факультет"])["n"]
+
+    def grade3_faculty_means(self, source):
+        sql = """
+            SELECT факультет, avg(средний_балл) AS mean FROM {data}
+            WHERE курс = '3-й' GROUP BY факультет ORDER BY min(_row)
+        """
+        means = self._query(source, sql)
+        return pd.Series(
+            means["mean"].to_numpy(), index=pd.Index(means["факультет"], name="факультет")
+        )
+
+    def grade3_rows(self, source, faculty):
+        sql = "SELECT * FROM {data} WHERE курс = '3-й' AND факультет = ? ORDER BY _row"
+        return _with_row_index(self._query(source, sql, [faculty]))
+
+    def popular_name(self, source):
+        sql = f"""
+            WITH names AS (
+                SELECT regexp_extract(фио, '{NAME_PATTERN}', 1) AS имя, _row FROM {{data}}
+            )
+            SELECT имя, count(*) AS n, (SELECT count(*) FROM names) AS total FROM names
+            WHERE имя <> '' GROUP BY имя ORDER BY n DESC, min(_row) LIMIT 1
+        """
+        name, count, total = self._query(source, sql).iloc[0]
+        return name, int(count), int(total)
+
+    def name_group(self, source, name):
+        sql = f"""
+            WITH data AS {{data}}, top AS (
+                SELECT группа FROM data WHERE regexp_extract(фио, '{NAME_PATTERN}', 1) = ?
+                GROUP BY группа ORDER BY count(*) DESC, min(_row) LIMIT 1
+            )
+            SELECT группа, факультет, курс FROM data JOIN top USING (группа)
+            ORDER BY _row LIMIT 1
+        """
+        return tuple(self._query(source, sql, [name]).iloc[0])
+
+    def isu_run_start(self, source, length):
+        sql = """
+            WITH isu AS (SELECT DISTINCT ису FROM {data} WHERE ису IS NOT NULL),
+            runs AS (SELECT ису, ису - row_number() OVER (ORDER BY ису) AS run FROM isu)
+            SELECT min(ису) AS first FROM runs GROUP BY run
+            HAVING count(*) >= ? ORDER BY first LIMIT 1
+        """
+        runs = self._query(source, sql, [length])
+        return int(runs["first"].iloc[0]) if len(runs) else None
+
+    def isu_rows(self, source, first, last):
+        columns = ", ".join(COLUMNS_9)
+        sql = f"SELECT {columns}, _row FROM {{data}} WHERE ису BETWEEN ? AND ? ORDER BY ису, _row"
+        return _with_row_index(self._query(source, sql, [first, last]))
+
+
+class PolarsBackend(QueryBackend):
+    """
+    Ленивые запросы Polars. engine="streaming" выполняет их потоково,
+    по частям, для данных больше памяти.
+    """
+
+    name = "polars"
+
+    def __init__(self, engine: str = "auto"):
+        if pl is None:
+            raise ImportError("для бэкенда polars нужен пакет polars")
+        self.engine = engine
+
+    def _scan(self, source: Source, columns: Optional[List[str]] = None) -> "pl.LazyFrame":
+        """
+        Ленивая таблица по источнику. Для файла columns не нужен: Polars сам
+        читает только используемые столбцы. Таблица pandas переводится в Polars
+        сразу, поэтому переводятся только столбцы columns (по умолчанию все).
+        """
+        if isinstance(source, pd.DataFrame):
+            frame = _polars_frame(source if columns is None else source[columns]).lazy()
+        elif _is_parquet(source):
+            frame = pl.scan_parquet(source)
+        else:
+            frame = pl.scan_csv(source)
+        return frame.with_row_index("_row")
+
+    def _collect(self, query: "pl.LazyFrame") -> pd.DataFrame:
+        frame = query.collect(engine=self.engine)
+        return pd.DataFrame({column: frame[column].to_numpy() for column in frame.columns})
+
+    def _names(self, source: Source, columns: List[str] = ("фио",)) -> "pl.LazyFrame":
+        return self._scan(source, list(columns)).with_columns(
+            pl.col("фио").str.extract(NAME_PATTERN, 1).alias("имя")
+        )
+
+    def faculty_rows(self, source, faculty):
+        query = self._scan(source).filter(pl.col("факультет") == faculty).sort("_row")
+        return _with_row_index(self._collect(query))
+
+    def faculty_counts(self, source):
+        query = (
+            self._scan(source, ["факультет"])
+            .group_by("факультет")
+            .agg(pl.len().alias("n"), pl.col("_row").min().alias("first"))
+            .sort("first")
+        )
+        counts = self._collect(query)
+        return pd.Series(
+            counts["n"].to_numpy(np.int64), index=pd.Index(counts["факультет"], name="факультет")
+        )
+
+    def course_faculty_counts(self, source):
+        query = (
+            self._scan(source, ["курс", "факультет"])
+            .group_by(["курс", "факультет"])
+            .agg(pl.len().alias("n"))
+            .sort(["курс", "факультет"])
+        )
+        return self._collect(query).set_index(["курс", "факультет"])["n"].astype(np.int64)
+
+    def grade3_faculty_means(self, source):
+        query = (
+            self._scan(source, ["курс", "факультет", "средний_балл"])
+            .filter(pl.col("курс") == "3-й")
+            .group_by("факультет")
+            .agg(pl.col("средний_балл").mean().alias("mean"), pl.col("_row").min().alias("first"))
+            .sort("first")
+        )
+        means = self._collect(query)
+        return pd.Series(
+            means["mean"].to_numpy(), index=pd.Index(means["факультет"], name="факультет")
+        )
+
+    def grade3_rows(self, source, faculty):
+        query = (
+            self._scan(source)
+            .filter((pl.col("курс") == "3-й") & (pl.col("факультет") == faculty))
+            .sort("_row")
+        )
+        return _with_row_index(self._collect(query))
+
+    def popular_name(self, source):
+        names = self._names(source)
+        top = (
+            names.filter(pl.col("имя").is_not_null())
+            .group_by("имя")
+            .agg(pl.len().alias("n"), pl.col("_row").min().alias("first"))
+            .sort(["n", "first"], descending=[True, False])
+            .head(1)
+        )
+        query = top.join(names.select(pl.len().alias("total")), how="cross")
+        name, count, _, total = self._collect(query).iloc[0]
+        return name, int(count), int(total)
+
+    def name_group(self, source, name):
+        names = self._names(source, ["фио", "группа", "факультет", "курс"])
+        top = (
+            names.filter(pl.col("имя") == name)
+            .group_by("группа")
+            .agg(pl.len().alias("n"), pl.col("_row").min().alias("first"))
+            .sort(["n", "first"], descending=[True, False])
+            .head(1)
+            .select("группа")
+        )
+        query = names.join(top, on="группа").sort("_row").head(1)
+        return tuple(self._collect(query.select(["группа", "факультет", "курс"])).iloc[0])
+
+    def isu_run_start(self, source, length):
+        query = (
+            self._scan(source, ["ису"])
+            .select(pl.col("ису").drop_nulls().unique().sort())
+            .with_columns((pl.col("ису") - pl.int_range(pl.len())).alias("run"))
+            .group_by("run")
+            .agg(pl.col("ису").min().alias("first"), pl.len().alias("n"))
+            .filter(pl.col("n") >= length)
+            .sort("first")
+            .head(1)
+        )
+        runs = self._collect(query)
+        return int(runs["first"].iloc[0]) if len(runs) else None
+
+    def isu_rows(self, source, first, last):
+        query = (
+            self._scan(source, COLUMNS_9)
+            .filter(pl.col("ису").is_between(first, last))
+            .sort(["ису", "_row"])
+            .select(COLUMNS_9 + ["_row"])
+        )
+        return _with_row_index(self._collect(query))
+
+
+BACKENDS = {"pandas": PandasBackend, "duckdb": DuckDBBackend, "polars": PolarsBackend}
+_ENGINES = {"pandas": pd, "duckdb": duckdb, "polars": pl}
+
+
+def available_backends() -> List[str]:
+    """
+    Бэкенды, для которых установлены нужные пакеты.
+    """
+    return [name for name in BACKENDS if _ENGINES[name] is not None]
+
+
+def get_backend(name: str, **options) -> Backend:
+    """
+    Создает бэкенд по имени; options передаются его конструктору.
+    """
+    if name not in BACKENDS:
+        raise ValueError(f"неизвестный бэкенд {name}, доступны: {', '.join(BACKENDS)}")
+    return BACKENDS[name](**options)
@@ -0,0 +1,97 @@
+"""
+Сравнение бэкендов (см. backends.py) на задачах 1, 4, 5, 6, 8 и 9.
+
+Для каждого размера датасет генерируется datagen.py и сохраняется в CSV
+(и в Parquet, если установлен DuckDB), после чего каждая задача выполняется
+каждым установленным бэкендом прямо по файлу: бэкенд pandas каждый раз читает
+файл целиком, DuckDB и Polars — только нужные столбцы. Время — лучшее из
+--repeat запусков. Таблица выводится в stderr, результаты — в JSON.
+
+Запуск: python bench_backends.py [--sizes 100000 1000000] [--formats csv parquet]
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import List, Optional
+
+from backends import available_backends, duckdb, get_backend
+from datagen import generate_students
+
+TASKS = [
+    "filter_fsuir_students",
+    "faculty_statistics",
+    "course_statistics",
+    "most_popular_name",
+    "highest_avg_grade_faculty",
+    "find_consecutive_students",
+]
+
+
+def write_sources(rows: int, directory: str, formats: List[str]) -> dict:
+    csv_path = os.path.join(directory, f"students_{rows}.csv")
+    generate_students(rows).to_csv(csv_path, index=False)
+    sources = {"csv": csv_path}
+    if "parquet" in formats and duckdb is not None:
+        parquet_path = os.path.join(directory, f"students_{rows}.parquet")
+        duckdb.sql(f"COPY (SELECT * FROM read_csv('{csv_path}')) TO '{parquet_path}'")
+        sources["parquet"] = parquet_path
+    return {kind: path for kind, path in sources.items() if kind in formats}
+
+
+def measure(method, source: str, repeat: int) -> Optional[float]:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        try:
+            method(source)
+        except ImportError:
+            # например, pandas без pyarrow не читает Parquet
+            return None
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--formats", nargs="+", default=["csv", "parquet"])
+    parser.add_argument("--backends", nargs="+", default=available_backends())
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", help="файл для JSON; по умолчанию стандартный вывод")
+    args = parser.parse_args()
+
+    backends = {name: get_backend(name) for name in args.backends}
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for rows in args.sizes:
+            for kind, path in write_sources(rows, directory, args.formats).items():
+                print(f"{rows} строк, {kind}:", file=sys.stderr)
+                for task in TASKS:
+                    times = {
+                        name: measure(getattr(backend, task), path, args.repeat)
+                        for name, backend in backends.items()
+                    }
+                    line = ", ".join(
+                        f"{name} {'—' if seconds is None else f'{seconds:.3f} с'}"
+                        for name, seconds in times.items()
+                    )
+                    print(f"  {task:>26}: {line}", file=sys.stderr)
+                    results += [
+                        {"rows": rows, "format": kind, "task": task, "backend": name, "seconds": s}
+                        for name, s in times.items()
+                    ]
+
+    report = {"backends": list(backends), "repeat": args.repeat, "results": results}
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
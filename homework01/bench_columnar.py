@@ -0,0 +1,68 @@
+"""
+Время загрузки и пиковый RSS: pd.read_csv с разбором ФИО против load_dataset
+из колоночного кэша. Каждый способ измеряется в отдельном процессе.
+
+Запуск: python bench_columnar.py [--copies 100]
+"""
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import pandas as pd
+
+
+def child(mode: str, path: str) -> None:
+    from columnar import load_dataset
+    from cs102_pandas import parse_names
+
+    start = time.perf_counter()
+    if mode == "csv":
+        data = pd.read_csv(path)
+    else:
+        data = load_dataset(path)
+    parse_names(data)
+    elapsed = time.perf_counter() - start
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(json.dumps({"mode": mode, "seconds": elapsed, "max_rss_mb": rss}))
+
+
+def measure(mode: str, path: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, __file__, "--child", mode, path],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies", type=int, default=100, help="сколько раз размножить isu_fake_data.csv"
+    )
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        child(*args.child)
+        return
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "students.csv")
+        data = pd.read_csv("isu_fake_data.csv")
+        pd.concat([data] * args.copies, ignore_index=True).to_csv(path, index=False)
+        print(f"строк: {len(data) * args.copies}")
+
+        measure("cache", path)  # первый запуск только строит кэш
+        for mode, title in [("csv", "read_csv + parse_names"), ("cache", "load_dataset")]:
+            result = measure(mode, path)
+            print(f"{title:>24}: {result['seconds']:.2f} с, RSS {result['max_rss_mb']:.0f} МБ")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Сравнение задачи 9: прежний рекурсивный перебор против нового
+find_consecutive_students (поиск серии через find_isu_runs и выборка ее строк).
+
+Рекурсивный вариант по умолчанию запускается только на таблицах
+до --legacy-max-rows строк (1 000 000): на 10 000 000 строк его строка
+таблицы пропускается («—»). Чтобы замерить и его, передайте
+--legacy-max-rows 10000000.
+
+Запуск: python bench_consecutive.py [--sizes 10000 1000000 10000000]
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+from cs102_pandas import find_consecutive_students
+
+
+def legacy_find_consecutive_students(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Прежняя реализация задачи 9: для каждой строки рекурсивно проверяет
+    наличие следующих номеров полным просмотром столбца.
+    """
+    data = data.sort_values(by="ису", ascending=True)
+
+    def find_sequence(start_isu, depth):
+        if depth == 0:
+            return []
+        if (data["ису"] == start_isu).any():
+            sequence = find_sequence(start_isu + 1, depth - 1)
+            if sequence is not None:
+                return [int(start_isu)] + sequence
+        return None
+
+    for i in range(len(data)):
+        current_isu = data["ису"].iloc[i]
+        sequence = find_sequence(current_isu, 5)
+        if sequence:
+            consecutive_students = data[data["ису"].isin(sequence)]
+            return consecutive_students[
+                ["фио", "ису", "факультет", "курс", "группа"]
+            ].sort_values(by="ису")
+
+
+def make_data(rows: int, density: float, seed: int = 0) -> pd.DataFrame:
+    """
+    Генерирует таблицу с номерами ИСУ, занимающими долю density диапазона номеров.
+    """
+    rng = np.random.default_rng(seed)
+    isu = rng.choice(int(rows / density), size=rows, replace=False) + 100000
+    return pd.DataFrame(
+        {
+            "фио": "Иванов Иван Иванович",
+            "ису": isu,
+            "факультет": "факультет",
+            "курс": "1-й",
+            "группа": "A1",
+        }
+    )
+
+
+def measure(func, data: pd.DataFrame) -> float:
+    start = time.perf_counter()
+    func(data)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 10_000_000])
+    parser.add_argument("--density", type=float, default=0.2)
+    parser.add_argument(
+        "--legacy-max-rows",
+        type=int,
+        default=1_000_000,
+        help="не запускать рекурсивный вариант на больших таблицах",
+    )
+    args = parser.parse_args()
+
+    print(f"{'строк':>10} {'рекурсия, с':>14} {'find_consecutive_students, с':>30}")
+    for rows in args.sizes:
+        data = make_data(rows, args.density)
+        legacy = (
+            f"{measure(legacy_find_consecutive_students, data):14.4f}"
+            if rows <= args.legacy_max_rows
+            else f"{'—':>14}"
+        )
+        vectorized = measure(find_consecutive_students, data)
+        print(f"{rows:>10} {legacy} {vectorized:30.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Пропускная способность определения пола по отчеству: прежние два прохода
+str.contains с регулярными выражениями против genders_by_patronym,
+который проверяет окончания один раз для каждого различного отчества.
+
+Запуск: python bench_gender.py [--copies 200]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from cs102_pandas import genders_by_patronym, parse_names
+
+
+def legacy_genders(patronyms: pd.Series) -> pd.Series:
+    """
+    Прежний способ из analyze_patronyms и highest_avg_grade_faculty.
+    """
+    male_patronymic_pattern = r".*(?:ович|евич|ич)$"
+    female_patronymic_pattern = r".*(?:овна|евна|ична|инична)$"
+    genders = pd.Series(None, index=patronyms.index, dtype=object)
+    genders[patronyms.str.contains(male_patronymic_pattern, na=False)] = "male"
+    genders[patronyms.str.contains(female_patronymic_pattern, na=False)] = "female"
+    return genders
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies", type=int, default=200, help="сколько раз размножить isu_fake_data.csv"
+    )
+    args = parser.parse_args()
+
+    data = pd.read_csv("isu_fake_data.csv")
+    patronyms = parse_names(data)["отчество"].astype(object)
+    patronyms = pd.concat([patronyms] * args.copies, ignore_index=True)
+    print(f"отчеств: {len(patronyms)}, различных: {patronyms.nunique()}")
+
+    for title, func, values in [
+        ("два прохода регулярных выражений", legacy_genders, patronyms),
+        ("genders_by_patronym", genders_by_patronym, patronyms),
+        ("genders_by_patronym, категории", genders_by_patronym, patronyms.astype("category")),
+    ]:
+        start = time.perf_counter()
+        func(values)
+        elapsed = time.perf_counter() - start
+        print(f"{title:>34}: {elapsed:.3f} с, {len(values) / elapsed / 1e6:.1f} млн строк/с")
+
+
+if __name__ == "__main__":
+    main()
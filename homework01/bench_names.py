@@ -0,0 +1,55 @@
+"""
+Сравнение разбора ФИО: прежнее многократное str.split() в каждой задаче
+против однократного parse_names с категориальными столбцами.
+Выводит время и объем памяти под фамилии, имена и отчества.
+
+Запуск: python bench_names.py [--copies 200]
+"""
+import argparse
+import time
+
+import pandas as pd
+
+from cs102_pandas import parse_names
+
+
+def legacy_split_names(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Столбцы, которые прежде дописывали в датасет задачи 2, 3, 6 и 7,
+    каждая со своим вызовом str.split.
+    """
+    return pd.DataFrame(
+        {
+            "фамилия": data["фио"].str.split().str[0],
+            "имя": data["фио"].str.split(" ").str[1],
+            "отчество": data["фио"].str.split().str[2],
+        }
+    )
+
+
+def megabytes(frame: pd.DataFrame) -> float:
+    return frame.memory_usage(deep=True, index=False).sum() / 2**20
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies", type=int, default=200, help="сколько раз размножить isu_fake_data.csv"
+    )
+    args = parser.parse_args()
+
+    data = pd.read_csv("isu_fake_data.csv")
+    data = pd.concat([data] * args.copies, ignore_index=True)
+    print(f"строк: {len(data)}")
+
+    start = time.perf_counter()
+    legacy = legacy_split_names(data)
+    print(f"str.split в каждой задаче: {time.perf_counter() - start:.2f} с, {megabytes(legacy):.1f} МБ")
+
+    start = time.perf_counter()
+    names = parse_names(data)
+    print(f"parse_names один раз:      {time.perf_counter() - start:.2f} с, {megabytes(names):.1f} МБ")
+
+
+if __name__ == "__main__":
+    main()
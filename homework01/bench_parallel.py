@@ -0,0 +1,42 @@
+"""
+Масштабирование сводок по факультетам (задачи 4, 5 и 8) по числу процессов:
+последовательный build_report против build_report(workers=1, 2, 4, 8).
+
+Запуск: python bench_parallel.py [--copies 300] [--workers 1 2 4 8]
+"""
+import argparse
+import os
+import time
+
+import pandas as pd
+
+from report import build_report
+
+
+def measure(data: pd.DataFrame, workers) -> float:
+    start = time.perf_counter()
+    build_report(data, tasks=[4, 5, 8], workers=workers)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--copies", type=int, default=300, help="сколько раз размножить isu_fake_data.csv"
+    )
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    args = parser.parse_args()
+
+    data = pd.read_csv("isu_fake_data.csv")
+    data = pd.concat([data] * args.copies, ignore_index=True)
+    print(f"строк: {len(data)}, ядер: {os.cpu_count()}")
+
+    serial = measure(data, None)
+    print(f"{'последовательно':>16}: {serial:.2f} с")
+    for workers in args.workers:
+        elapsed = measure(data, workers)
+        print(f"{workers:>7} процессов: {elapsed:.2f} с, ускорение {serial / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""
+Время и пиковая память каждой из девяти задач на синтетических датасетах
+разного размера (см. datagen.py), а также отчета build_report целиком.
+
+Каждая задача запускается на новой неглубокой копии таблицы, чтобы не брать
+разобранные ФИО и индексы из кэша предыдущих задач; подвыборка ФСУиР для задач 2
+и 3 готовится заранее и в замер не входит. Пиковая память считается через
+tracemalloc, время — лучшее из --repeat запусков. Результаты выводятся в JSON.
+
+Запуск: python bench_tasks.py [--sizes 10000 100000 1000000 10000000] [--output bench.json]
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from cs102_pandas import (
+    analyze_patronyms,
+    course_statistics,
+    faculty_statistics,
+    filter_fsuir_students,
+    find_consecutive_students,
+    find_homonymous_students,
+    find_students_with_name_starting_P,
+    highest_avg_grade_faculty,
+    most_popular_name,
+)
+from datagen import generate_students
+from report import build_report
+
+
+def task_runners(data: pd.DataFrame) -> Dict[str, Callable[[pd.DataFrame], object]]:
+    fsuir = filter_fsuir_students(data)[2]
+    return {
+        "1": filter_fsuir_students,
+        "2": lambda _: find_homonymous_students(fsuir.copy(deep=False)),
+        "3": lambda _: analyze_patronyms(fsuir.copy(deep=False)),
+        "4": faculty_statistics,
+        "5": course_statistics,
+        "6": most_popular_name,
+        "7": find_students_with_name_starting_P,
+        "8": highest_avg_grade_faculty,
+        "9": find_consecutive_students,
+        "отчет": build_report,
+    }
+
+
+def measure(func: Callable[[pd.DataFrame], object], data: pd.DataFrame, repeat: int) -> dict:
+    seconds = []
+    for _ in range(repeat):
+        fresh = data.copy(deep=False)
+        start = time.perf_counter()
+        func(fresh)
+        seconds.append(time.perf_counter() - start)
+
+    fresh = data.copy(deep=False)
+    tracemalloc.start()
+    try:
+        func(fresh)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(seconds), "peak_bytes": peak}
+
+
+def run(sizes: List[int], repeat: int, seed: int) -> dict:
+    results = []
+    for rows in sizes:
+        start = time.perf_counter()
+        data = generate_students(rows, seed)
+        generated = time.perf_counter() - start
+        print(f"{rows} строк: сгенерировано за {generated:.2f} с", file=sys.stderr)
+        for task, func in task_runners(data).items():
+            result = {"rows": rows, "task": task, **measure(func, data, repeat)}
+            print(
+                f"  {task:>5}: {result['seconds']:.4f} с, "
+                f"{result['peak_bytes'] / 2**20:.1f} МиБ",
+                file=sys.stderr,
+            )
+            results.append(result)
+    return {
+        "python": platform.python_version(),
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000, 10_000_000]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", help="файл для JSON; по умолчанию стандартный вывод")
+    args = parser.parse_args()
+
+    report = run(args.sizes, args.repeat, args.seed)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            json.dump(report, file, ensure_ascii=False, indent=2)
+    else:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,178 @@
+"""
+Колоночный кэш датасета студентов в формате NumPy (.npy).
+
+При первом чтении CSV каждый столбец сохраняется в отдельный файл с типом:
+строковые столбцы («факультет», «курс», «группа», «фио») — как коды категорий
+и массив самих категорий, «ису» — int32 (float64, если в нем есть пропуски),
+«средний_балл» — float32. Рядом сохраняются уже разобранные фамилия, имя
+и отчество (см. parse_names).
+Следующие запуски открывают файлы через np.load(mmap_mode="r"), и столбцы
+датасета ссылаются на отображенную в память область без копирования.
+
+Кэш пересобирается, если у исходного CSV изменились размер и время изменения
+и при этом изменилось содержимое (хэш SHA-256).
+"""
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from cs102_pandas import NAME_PARTS, parse_names, remember_names
+
+CACHE_VERSION = 2
+NUMERIC_TYPES = {"ису": np.int32, "средний_балл": np.float32}
+
+
+def default_cache_dir(path: str) -> Path:
+    source = Path(path)
+    return source.parent / ".cs102_cache" / source.name
+
+
+def file_hash(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for block in iter(lambda: source.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_info(path: str, with_hash: bool = True) -> dict:
+    stat = os.stat(path)
+    info = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+    if with_hash:
+        info["sha256"] = file_hash(path)
+    return info
+
+
+def _codes_dtype(num_categories: int):
+    # тот же выбор ширины кодов, что и у pd.Categorical
+    for dtype in (np.int8, np.int16, np.int32):
+        if num_categories < np.iinfo(dtype).max:
+            return dtype
+    return np.int64
+
+
+def _save_categorical(values: pd.Series, cache_dir: Path, file: str) -> dict:
+    codes, categories = pd.factorize(values, sort=True)
+    codes = codes.astype(_codes_dtype(len(categories)))
+    np.save(cache_dir / f"{file}.npy", codes)
+    np.save(cache_dir / f"{file}.categories.npy", np.asarray(categories, dtype=str))
+    return {"kind": "category", "file": file}
+
+
+def _save_numeric(values: pd.Series, dtype, cache_dir: Path, file: str) -> dict:
+    values = values.to_numpy()
+    if dtype is not None and np.issubdtype(dtype, np.integer):
+        # пропуски (NaN) в целый тип не переводятся: столбец остается float
+        if np.issubdtype(values.dtype, np.floating) and np.isnan(values).any():
+            dtype = None
+        else:
+            limits = np.iinfo(dtype)
+            if values.size and (values.min() < limits.min or values.max() > limits.max):
+                dtype = None
+    if dtype is not None:
+        values = values.astype(dtype)
+    np.save(cache_dir / f"{file}.npy", values)
+    return {"kind": "numeric", "file": file}
+
+
+def write_cache(path: str, cache_dir: Optional[Path] = None) -> Path:
+    """
+    Читает CSV и сохраняет его в колоночный кэш. Возвращает папку кэша.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir(path)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    meta_path = cache_dir / "meta.json"
+    if meta_path.exists():
+        meta_path.unlink()
+
+    source = _source_info(path)
+    data = pd.read_csv(path)
+    columns = []
+    for i, column in enumerate(data.columns):
+        values = data[column]
+        if values.dtype == object:
+            spec = _save_categorical(values, cache_dir, f"column{i}")
+        else:
+            spec = _save_numeric(values, NUMERIC_TYPES.get(column), cache_dir, f"column{i}")
+        columns.append({"name": column, **spec})
+
+    names = parse_names(data)
+    name_parts = [
+        {"name": part, **_save_categorical(names[part], cache_dir, f"name{i}")}
+        for i, part in enumerate(NAME_PARTS)
+    ]
+
+    meta = {"version": CACHE_VERSION, "source": source, "columns": columns, "names": name_parts}
+    _write_meta(meta_path, meta)
+    return cache_dir
+
+
+def _write_meta(meta_path: Path, meta: dict) -> None:
+    temporary = meta_path.with_suffix(".tmp")
+    temporary.write_text(json.dumps(meta, ensure_ascii=False))
+    os.replace(temporary, meta_path)
+
+
+def _read_meta(cache_dir: Path) -> Optional[dict]:
+    try:
+        meta = json.loads((cache_dir / "meta.json").read_text())
+    except (OSError, ValueError):
+        return None
+    return meta if meta.get("version") == CACHE_VERSION else None
+
+
+def is_cache_fresh(path: str, cache_dir: Optional[Path] = None) -> bool:
+    """
+    Проверяет, соответствует ли кэш текущему CSV. Если изменилось только время
+    изменения файла, а содержимое осталось прежним, кэш считается актуальным.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir(path)
+    meta = _read_meta(cache_dir)
+    if meta is None:
+        return False
+    current = _source_info(path, with_hash=False)
+    cached = meta["source"]
+    if current["mtime_ns"] == cached["mtime_ns"] and current["size"] == cached["size"]:
+        return True
+    if current["size"] != cached["size"] or file_hash(path) != cached["sha256"]:
+        return False
+    meta["source"] = {**cached, **current}
+    _write_meta(cache_dir / "meta.json", meta)
+    return True
+
+
+def _load_column(spec: dict, cache_dir: Path):
+    values = np.load(cache_dir / f"{spec['file']}.npy", mmap_mode="r")
+    if spec["kind"] == "numeric":
+        return values
+    categories = np.load(cache_dir / f"{spec['file']}.categories.npy")
+    dtype = pd.CategoricalDtype(pd.Index(categories.astype(object)))
+    return pd.Categorical.from_codes(values, dtype=dtype, validate=False)
+
+
+def load_dataset(path: str = "isu_fake_data.csv", cache_dir: Optional[Path] = None) -> pd.DataFrame:
+    """
+    Загружает датасет из колоночного кэша, при необходимости создавая
+    или пересобирая его по CSV. Разобранные части ФИО сразу попадают в кэш
+    parse_names, так что задачи не разбирают ФИО заново.
+    """
+    cache_dir = Path(cache_dir) if cache_dir is not None else default_cache_dir(path)
+    if not is_cache_fresh(path, cache_dir):
+        write_cache(path, cache_dir)
+    meta = _read_meta(cache_dir)
+
+    data = pd.DataFrame(
+        {spec["name"]: _load_column(spec, cache_dir) for spec in meta["columns"]}, copy=False
+    )
+    names = pd.DataFrame(
+        {spec["name"]: _load_column(spec, cache_dir) for spec in meta["names"]},
+        index=data.index,
+        copy=False,
+    )
+    remember_names(data, names)
+    return data
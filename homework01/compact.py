@@ -0,0 +1,73 @@
+"""
+Уменьшение памяти датасета студентов за счет типов столбцов.
+
+Строковые столбцы с небольшим числом различных значений («факультет», «курс»,
+«группа») становятся категориальными, числовые приводятся к самому узкому
+подходящему типу, а ФИО хранятся строками Arrow, если установлен pyarrow.
+
+Запуск: python compact.py [путь_к_csv]
+"""
+import sys
+from typing import Iterable
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+except ImportError:
+    ARROW_STRING = None
+else:
+    ARROW_STRING = pd.StringDtype("pyarrow")
+
+NAME_COLUMNS = ("фио",)
+
+
+def optimize_dtypes(
+    data: pd.DataFrame, max_category_ratio: float = 0.5, name_columns: Iterable[str] = NAME_COLUMNS
+) -> pd.DataFrame:
+    """
+    Возвращает копию датасета с компактными типами столбцов:
+     - строковые столбцы, где различных значений не больше max_category_ratio
+       от числа строк, — категориальные
+     - столбцы из name_columns — строки Arrow (без pyarrow остаются как есть)
+     - целые и дробные числа — самый узкий тип, вмещающий значения
+    """
+    name_columns = set(name_columns)
+    columns = {}
+    for column in data.columns:
+        values = data[column]
+        if values.dtype == object:
+            if column in name_columns:
+                if ARROW_STRING is not None:
+                    values = values.astype(ARROW_STRING)
+            elif values.nunique() <= max_category_ratio * len(values):
+                values = values.astype("category")
+        elif pd.api.types.is_integer_dtype(values):
+            values = pd.to_numeric(values, downcast="integer")
+        elif pd.api.types.is_float_dtype(values):
+            values = pd.to_numeric(values, downcast="float")
+        columns[column] = values
+    return pd.DataFrame(columns, index=data.index)
+
+
+def memory_report(before: pd.DataFrame, after: pd.DataFrame) -> pd.DataFrame:
+    """
+    Память по столбцам в байтах до и после оптимизации, а также итоговая строка.
+    """
+    report = pd.DataFrame(
+        {
+            "тип_до": before.dtypes.astype(str),
+            "тип_после": after.dtypes.astype(str),
+            "байт_до": before.memory_usage(deep=True, index=False),
+            "байт_после": after.memory_usage(deep=True, index=False),
+        }
+    )
+    report.loc["всего"] = ["", "", report["байт_до"].sum(), report["байт_после"].sum()]
+    report["доля"] = (report["байт_после"] / report["байт_до"]).round(3)
+    return report
+
+
+if __name__ == "__main__":
+    path = sys.argv[1] if len(sys.argv) > 1 else "isu_fake_data.csv"
+    data = pd.read_csv(path)
+    print(memory_report(data, optimize_dtypes(data)))
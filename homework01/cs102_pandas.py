@@ -1,23 +1,243 @@
+import numpy as np
 import pandas as pd
 import re
-from typing import Tuple
+import weakref
+from bisect import bisect_left
+from typing import Any, Dict, List, Optional, Tuple
+
+from profiling import profiled
+
+
+NAME_PARTS = ["фамилия", "имя", "отчество"]
+GENDERS = ["male", "female", "unknown"]
+FSUIR = "факультет систем управления и робототехники"
+
+MALE_PATRONYM_SUFFIXES = ("ич", "оглы", "оглу", "улы", "уулу", "угли")
+FEMALE_PATRONYM_SUFFIXES = ("овна", "евна", "ична", "кызы", "гызы", "кизи")
+
+_dataset_cache: Dict[int, Tuple[weakref.ref, tuple, Dict[str, Any]]] = {}
+
+
+def _signature(data: pd.DataFrame) -> tuple:
+    # замена столбца или индекса подменяет эти объекты, и кэш датасета сбрасывается
+    return (data.index, data.columns, *data._mgr.arrays)
+
+
+def _same_entry(entry: Optional[tuple], data: pd.DataFrame) -> bool:
+    if entry is None or entry[0]() is not data:
+        return False
+    signature = _signature(data)
+    return len(signature) == len(entry[1]) and all(
+        a is b for a, b in zip(signature, entry[1])
+    )
+
+
+def _cached(data: pd.DataFrame, key: str) -> Any:
+    # кэш привязан к объекту датасета, его индексу и столбцам и очищается вместе с датасетом
+    entry = _dataset_cache.get(id(data))
+    if not _same_entry(entry, data):
+        return None
+    return entry[2].get(key)
+
+
+def _remember(data: pd.DataFrame, key: str, value: Any) -> None:
+    entry = _dataset_cache.get(id(data))
+    if entry is None:
+        weakref.finalize(data, _dataset_cache.pop, id(data), None)
+    if not _same_entry(entry, data):
+        entry = (weakref.ref(data), _signature(data), {})
+        _dataset_cache[id(data)] = entry
+    entry[2][key] = value
+
+
+def parse_names(data: pd.DataFrame) -> pd.DataFrame:
+    """
+    Разбивает столбец "фио" на фамилию, имя и отчество; отчеством считаются
+    все слова после имени.
+    Части хранятся как категориальные столбцы с тем же индексом, что и у датасета,
+    поэтому каждая фамилия, имя и отчество хранится в памяти один раз.
+    Разбиение выполняется один раз: результат кэшируется для данного объекта
+    датасета и переиспользуется всеми задачами. Сам датасет не изменяется.
+    """
+    names = _cached(data, "names")
+    if names is not None:
+        return names
+
+    # разбиваются только различные ФИО, строки ссылаются на них кодами
+    codes, full_names = pd.factorize(data["фио"])
+    # отчество — весь остаток после имени, чтобы тюркские "Тарлан оглы" и "Джовдат кызы"
+    # попадали в него целиком и пол определялся по "оглы"/"кызы"
+    parts = pd.Series(full_names).str.split(n=2, expand=True).reindex(columns=range(3))
+    names = pd.DataFrame(index=data.index)
+    for column, part in zip(NAME_PARTS, parts):
+        part_codes, categories = pd.factorize(parts[part])
+        names[column] = pd.Categorical.from_codes(np.append(part_codes, -1)[codes], categories)
+    remember_names(data, names)
+    return names
+
+
+def remember_names(data: pd.DataFrame, names: pd.DataFrame) -> None:
+    """
+    Запоминает уже разобранные части ФИО для датасета,
+    например прочитанные из кэша на диске (см. columnar.py).
+    """
+    _remember(data, "names", names)
+
+
+def _positions_by_value(values: pd.Series) -> Dict[Any, np.ndarray]:
+    codes, uniques = pd.factorize(values)
+    order = np.argsort(codes, kind="stable")
+    bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+    return {value: order[bounds[i] : bounds[i + 1]] for i, value in enumerate(uniques)}
+
+
+class StudentIndex:
+    """
+    Индексы датасета для поиска без полного просмотра столбцов:
+     - отсортированные номера ИСУ и позиции строк в этом порядке
+     - позиции строк каждой группы, каждого факультета и каждого имени
+       (в порядке строк датасета)
+     - отсортированный список различных имен для поиска по префиксу
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        isu = data["ису"].to_numpy()
+        self.isu_order = np.argsort(isu, kind="stable")
+        self.isu_sorted = isu[self.isu_order]
+        self.group_rows = _positions_by_value(data["группа"])
+        self.faculty_rows = _positions_by_value(data["факультет"])
+        self.name_rows = _positions_by_value(parse_names(data)["имя"])
+        self.names_sorted = sorted(self.name_rows)
+
+    def has_isu(self, isu: int) -> bool:
+        i = np.searchsorted(self.isu_sorted, isu)
+        return bool(i < self.isu_sorted.size and self.isu_sorted[i] == isu)
+
+    def rows_with_isu(self, values) -> np.ndarray:
+        """
+        Позиции строк с номерами ИСУ из values в порядке возрастания номера.
+        """
+        values = np.unique(np.asarray(values))
+        first = np.searchsorted(self.isu_sorted, values, side="left")
+        last = np.searchsorted(self.isu_sorted, values, side="right")
+        parts = [self.isu_order[i:j] for i, j in zip(first, last)]
+        return np.concatenate(parts) if parts else np.empty(0, dtype=np.intp)
+
+    def names_with_prefix(self, prefix: str) -> List[str]:
+        first = bisect_left(self.names_sorted, prefix)
+        last = bisect_left(self.names_sorted, prefix + chr(0x10FFFF))
+        return self.names_sorted[first:last]
+
+
+def build_index(data: pd.DataFrame) -> StudentIndex:
+    """
+    Строит индексы датасета один раз и запоминает их; после этого задачи 1, 6, 7 и 9
+    пользуются ими вместо просмотра столбцов целиком.
+    """
+    index = _cached(data, "index")
+    if index is None:
+        index = StudentIndex(data)
+        _remember(data, "index", index)
+    return index
 
 
 # Задача 1
-def filter_fsuir_students(data: pd.DataFrame) -> Tuple[int, int, pd.DataFrame]:
+@profiled(1)
+def filter_fsuir_students(
+    data: pd.DataFrame, faculty: str = FSUIR
+) -> Tuple[int, int, pd.DataFrame]:
     """
     Создает подвыборку студентов факультета систем управления и робототехники (ФСУиР).
     Возвращает количество таких студентов, количество уникальных групп и отфильтрованный датасет.
+    Другой факультет можно выбрать параметром faculty.
     """
-    data_fsuir = data[
-        data["факультет"] == "факультет систем управления и робототехники"
-        ].copy()
+    index = _cached(data, "index")
+    if index is not None:
+        rows = index.faculty_rows.get(faculty, np.empty(0, dtype=np.intp))
+    else:
+        rows = np.flatnonzero(data["факультет"] == faculty)
+    # take уже возвращает отдельный датасет, лишнее копирование не нужно
+    data_fsuir = data.take(rows)
+    names = _cached(data, "names")
+    if names is not None:
+        remember_names(data_fsuir, names.iloc[rows])
     fsuir_students_len = data_fsuir.shape[0]
     fsuir_groups_len = len(set(data_fsuir["группа"]))
     return (fsuir_students_len, fsuir_groups_len, data_fsuir)
 
 
 # Задача 2
+# формы женских фамилий и соответствующие мужские: Иванова -> Иванов, Достоевская -> Достоевский
+FEMALE_SURNAME_ENDINGS = [
+    ("ская", "ский"),
+    ("цкая", "цкий"),
+    ("ова", "ов"),
+    ("ева", "ев"),
+    ("ёва", "ёв"),
+    ("ина", "ин"),
+    ("ына", "ын"),
+]
+
+
+def normalize_surnames(surnames: pd.Series) -> pd.Series:
+    """
+    Приводит женские формы фамилий к мужским, чтобы Иванов и Иванова
+    считались одной фамилией. Окончания проверяются один раз для каждой
+    различной фамилии. Возвращает категориальную серию с тем же индексом.
+    """
+    codes, uniques = pd.factorize(surnames)
+    uniques = pd.Series(uniques, dtype=object)
+    for female, male in FEMALE_SURNAME_ENDINGS:
+        is_female = uniques.str.endswith(female, na=False)
+        uniques[is_female] = uniques[is_female].str[: -len(female)] + male
+    normalized_codes, categories = pd.factorize(uniques)
+    return pd.Series(
+        pd.Categorical.from_codes(np.append(normalized_codes, -1)[codes], categories),
+        index=surnames.index,
+        name="фамилия",
+    )
+
+
+def _surnames(data: pd.DataFrame, normalize_gender: bool) -> pd.Series:
+    surnames = parse_names(data)["фамилия"]
+    return normalize_surnames(surnames) if normalize_gender else surnames
+
+
+def namesake_counts(
+    data: pd.DataFrame, keys: List[str] = (), normalize_gender: bool = False
+) -> pd.Series:
+    """
+    Для каждого студента — сколько студентов с той же фамилией в его группе
+    строк по столбцам keys (например, ["факультет", "курс"]); без keys — во всем
+    датасете. Считается одной группировкой по keys и фамилии с transform.
+    Строки без фамилии (или без значения keys) ни с кем не группируются: для них 0.
+    """
+    surnames = _surnames(data, normalize_gender)
+    by = [data[key] for key in keys] + [surnames]
+    counts = surnames.groupby(by, sort=False, observed=True).transform("size")
+    return counts.fillna(0).astype(np.int64)
+
+
+def find_homonyms(
+    data: pd.DataFrame, keys: List[str] = ("факультет",), normalize_gender: bool = False
+) -> pd.DataFrame:
+    """
+    Однофамильцы для всех значений keys сразу: по строке на каждую фамилию,
+    которая встречается в группе keys больше одного раза.
+    Столбцы: keys, "фамилия", "количество"; строки упорядочены по keys
+    и по убыванию количества.
+    """
+    keys = list(keys)
+    surnames = _surnames(data, normalize_gender)
+    counts = surnames.groupby([data[key] for key in keys] + [surnames], observed=True).size()
+    counts = counts[counts > 1].rename("количество").reset_index()
+    counts.columns = keys + ["фамилия", "количество"]
+    return counts.sort_values(
+        keys + ["количество"], ascending=[True] * len(keys) + [False], kind="stable"
+    ).reset_index(drop=True)
+
+
+@profiled(2)
 def find_homonymous_students(data_fsuir: pd.DataFrame) -> Tuple[bool, int, pd.Series, str]:
     """
     Проверяет наличие однофамильцев на ФСУиР, их количество, распределение по курсам
@@ -28,56 +248,67 @@ def find_homonymous_students(data_fsuir: pd.DataFrame) -> Tuple[bool, int, pd.Se
      - серию с числом однофамильцев по курсам
      - группу с максимальным числом однофамильцев
     """
-    data_fsuir["фамилия"] = data_fsuir["фио"].str.split().str[0]
-    surname_counts_total = data_fsuir.groupby("фамилия").size()
-    namesakes_total = surname_counts_total[surname_counts_total > 1].index
-    data_namesakes_total = data_fsuir[data_fsuir["фамилия"].isin(namesakes_total)]
-    num_namesakes_total = data_namesakes_total.shape[0]
-
-    course_surname_counts = []
-    for course in data_fsuir["курс"].unique():
-        data_course = data_fsuir[data_fsuir["курс"] == course]
-        surname_counts_course = data_course.groupby("фамилия").size()
-        namesakes_course = surname_counts_course[surname_counts_course > 1].index
-        data_namesakes_course = data_course[data_course["фамилия"].isin(namesakes_course)]
-        course_surname_counts.append(
-            {"курс": course, "количество_на_курсе": data_namesakes_course.shape[0]}
-        )
+    is_namesake = namesake_counts(data_fsuir) > 1
+    num_namesakes_total = int(is_namesake.sum())
 
-    course_surname_counts_data = pd.DataFrame(course_surname_counts)
-    course_surname_counts_data = course_surname_counts_data.sort_values(
-        by="курс", key=lambda x: x.str.extract(r"(\d+)", expand=False).astype(int)
+    courses = data_fsuir["курс"]
+    homonyms_per_course = (
+        (namesake_counts(data_fsuir, ["курс"]) > 1).groupby(courses, observed=True).sum()
     )
+    homonyms_per_course.index = homonyms_per_course.index.astype(object)
+    homonyms_per_course = homonyms_per_course.sort_index(
+        key=lambda x: x.str.extract(r"(\d+)", expand=False).astype(int)
+    ).rename(None)
+    homonyms_per_course.index.name = None
 
-    group_surname_counts = (
-        data_namesakes_total.groupby("группа")
-        .size()
-        .reset_index(name="количество_в_группе")
-    )
-    max_group = group_surname_counts.loc[
-        group_surname_counts["количество_в_группе"].idxmax()
-    ]
-
-    homonyms_per_course = {
-        row["курс"]: row["количество_на_курсе"] for _, row in course_surname_counts_data.iterrows()
-    }
+    max_group = data_fsuir.loc[is_namesake, "группа"].value_counts(sort=False).sort_index().idxmax()
 
-    return (
-        True,
-        num_namesakes_total,
-        pd.Series(homonyms_per_course),
-        max_group["группа"],
-    )
+    return (True, num_namesakes_total, homonyms_per_course, max_group)
 
 
 # Задача 3
 def gender_identification(patronym: str) -> str:
     """
     Определяет пол по отчеству. Возвращает пол: female/male/unknown.
+    Пол определяется по окончанию последнего слова отчества, поэтому тюркские
+    формы вроде "Тарлан оглы" и "Джовдат кызы" тоже распознаются.
+    Для отсутствующего или пустого отчества возвращается unknown.
     """
-    pass
+    if not isinstance(patronym, str) or not patronym.strip():
+        return "unknown"
+    last_word = patronym.split()[-1].lower()
+    if last_word.endswith(FEMALE_PATRONYM_SUFFIXES):
+        return "female"
+    if last_word.endswith(MALE_PATRONYM_SUFFIXES):
+        return "male"
+    return "unknown"
+
+
+def genders_by_patronym(patronyms: pd.Series) -> pd.Series:
+    """
+    Определяет пол по отчеству для всей серии отчеств по тем же правилам,
+    что и gender_identification. Окончания проверяются один раз для каждого
+    различного отчества, после чего результат раскладывается по строкам.
+    Возвращает категориальную серию male/female/unknown с тем же индексом.
+    """
+    codes, unique_patronyms = pd.factorize(patronyms)
+    unique_patronyms = pd.Series(np.asarray(unique_patronyms, dtype=object))
+    last_words = unique_patronyms.str.split().str[-1].str.lower()
+    unique_genders = np.select(
+        [
+            last_words.str.endswith(FEMALE_PATRONYM_SUFFIXES, na=False).to_numpy(bool),
+            last_words.str.endswith(MALE_PATRONYM_SUFFIXES, na=False).to_numpy(bool),
+        ],
+        [GENDERS.index("female"), GENDERS.index("male")],
+        GENDERS.index("unknown"),
+    )
+    gender_codes = np.append(unique_genders, GENDERS.index("unknown"))[codes]
+    return pd.Series(
+        pd.Categorical.from_codes(gender_codes, categories=GENDERS), index=patronyms.index
+    )
 
 
+@profiled(3)
 def analyze_patronyms(data_fsuir: pd.DataFrame) -> Tuple[int, pd.Series]:
     """
     Определяет количество студентов без отчества и распределение студентов по полу на основе отчества.
@@ -85,44 +316,33 @@ def analyze_patronyms(data_fsuir: pd.DataFrame) -> Tuple[int, pd.Series]:
      - количество студентов без отчества
      - серию с распределением студентов по полу 
     """
-    data_fsuir["отчество"] = data_fsuir["фио"].str.split().str[2]
-    data_fsuir["есть_отчество"] = data_fsuir["отчество"].notna()
-    students_no_dad = data_fsuir[~data_fsuir["есть_отчество"]]
-    num_students_no_dad = students_no_dad.shape[0]
-
-    male_patronymic_pattern = r".*(?:ович|евич|ич)$"
-    female_patronymic_pattern = r".*(?:овна|евна|ична|инична)$"
-
-    data_fsuir["пол_по_отчеству"] = None
-    data_fsuir.loc[
-        data_fsuir["отчество"].str.contains(male_patronymic_pattern, na=False),
-        "пол_по_отчеству",
-    ] = "male"
-    data_fsuir.loc[
-        data_fsuir["отчество"].str.contains(female_patronymic_pattern, na=False),
-        "пол_по_отчеству",
-    ] = "female"
-    num_male = data_fsuir[data_fsuir["пол_по_отчеству"] == "male"].shape[0]
-    num_female = data_fsuir[data_fsuir["пол_по_отчеству"] == "female"].shape[0]
+    patronyms = parse_names(data_fsuir)["отчество"]
+    num_students_no_dad = int(patronyms.isna().sum())
+
+    genders = genders_by_patronym(patronyms)
+    num_male = int((genders == "male").sum())
+    num_female = int((genders == "female").sum())
     gender_counts = {"male": num_male, "female": num_female}
     return (num_students_no_dad, pd.Series(gender_counts))
 
 
 # Задача 4
-def faculty_statistics(data: pd.DataFrame) -> Tuple[pd.DataFrame, Tuple[str, int], Tuple[str, int]]:
+@profiled(4)
+def faculty_statistics(
+    data: pd.DataFrame, faculty_counts: Optional[pd.Series] = None
+) -> Tuple[pd.DataFrame, Tuple[str, int], Tuple[str, int]]:
     """
     Подсчитывает количество студентов на каждом факультете,
     а также определяет факультеты с максимальным и минимальным числом студентов.
+    Уже посчитанное число студентов по факультетам (в порядке первого появления
+    факультета) можно передать в faculty_counts.
     """
-    faculty_students_counts = []
-    for faculty in data["факультет"].unique():
-        data_faculty = data[data["факультет"] == faculty]
-        data_students_faculty = data_faculty.groupby("факультет").size()
-        faculty_students_counts.append(
-            {"факультет": faculty, "количество": data_students_faculty.values[0]}
-        )
+    if faculty_counts is None:
+        faculty_counts = data.groupby("факультет", sort=False, observed=True).size()
 
-    faculty_students_counts_data = pd.DataFrame(faculty_students_counts)
+    faculty_students_counts_data = pd.DataFrame(
+        {"факультет": faculty_counts.index, "количество": faculty_counts.to_numpy()}
+    )
 
     max_faculty = faculty_students_counts_data.loc[
         faculty_students_counts_data["количество"].idxmax()
@@ -134,18 +354,27 @@ def faculty_statistics(data: pd.DataFrame) -> Tuple[pd.DataFrame, Tuple[str, int
 
 
 # Задача 5
-def course_statistics(data: pd.DataFrame) -> Tuple[pd.Series, pd.Series]:
+@profiled(5)
+def course_statistics(
+    data: pd.DataFrame, course_faculty_counts: Optional[pd.Series] = None
+) -> Tuple[pd.Series, pd.Series]:
     """
     Вычисляет среднее и медианное число студентов на каждом курсе.
     Возвращает две серии с результатами: сначала средние, потом медиана.
+    Уже посчитанное число студентов по парам (курс, факультет) можно передать
+    в course_faculty_counts.
     """
-    sorted = data.groupby("курс")["факультет"].value_counts()
-    stats = sorted.groupby("курс").agg(["mean", "median"])
+    if course_faculty_counts is None:
+        course_faculty_counts = data.groupby(["курс", "факультет"], observed=True).size()
+    stats = course_faculty_counts.groupby(level="курс", observed=True).agg(["mean", "median"])
     return stats["mean"], stats["median"]
 
 
 # Задача 6
-def most_popular_name(data: pd.DataFrame) -> Tuple[str, str, str, int, float]:
+@profiled(6)
+def most_popular_name(
+    data: pd.DataFrame, name_counts: Optional[pd.Series] = None
+) -> Tuple[str, str, str, int, float]:
     """
     Определяет самое популярное имя, группу с наибольшим количеством студентов с этим именем,
     факультет, курс и долю таких студентов в общем числе.
@@ -154,106 +383,134 @@ def most_popular_name(data: pd.DataFrame) -> Tuple[str, str, str, int, float]:
      2. группа
      3. факультет
      4. доля
+    Уже посчитанную частоту имен можно передать в name_counts.
     """
-    data["имя"] = data["фио"].str.split(" ").str[1]
-    popular_name = data["имя"].value_counts().idxmax()
-
-    name_group = data[data["имя"] == popular_name]["группа"].value_counts().idxmax()
-
-    faculty = data[data["группа"] == name_group]["факультет"].iloc[0]
-
-    course = data[data["группа"] == name_group]["курс"].iloc[0]
-
-    num_copies_popular_name = data["имя"].value_counts().max()
+    names = parse_names(data)["имя"]
+    if name_counts is None:
+        name_counts = names.value_counts()
+    popular_name = name_counts.idxmax()
+
+    index = _cached(data, "index")
+    if index is not None:
+        name_rows = index.name_rows[popular_name]
+        name_group = data["группа"].iloc[name_rows].value_counts().idxmax()
+        group_row = index.group_rows[name_group][0]
+        faculty = data["факультет"].iloc[group_row]
+        course = data["курс"].iloc[group_row]
+    else:
+        name_group = data[names == popular_name]["группа"].value_counts().idxmax()
+
+        faculty = data[data["группа"] == name_group]["факультет"].iloc[0]
+
+        course = data[data["группа"] == name_group]["курс"].iloc[0]
+
+    num_copies_popular_name = name_counts.max()
     name_ratio = round(num_copies_popular_name / len(data), 2)
     return (popular_name, name_group, faculty, course, name_ratio)
 
 
 # Задача 7
-def find_students_with_name_starting_P(data: pd.DataFrame) -> pd.DataFrame:
+@profiled(7)
+def find_students_with_name_starting_P(
+    data: pd.DataFrame, name_counts: Optional[pd.Series] = None, prefix: str = "П"
+) -> pd.DataFrame:
     """
     Находит студентов, чье имя встречается ровно один раз и начинается на "П". Выводит их ФИО, факультет и курс.
+    Уже посчитанную частоту имен можно передать в name_counts, другое начало имени — в prefix.
     """
-    data["имя"] = data["фио"].str.split(" ").str[1]
-    starts_with_p = data[data["имя"].str.startswith("П")]
-    name_counts = starts_with_p["имя"].value_counts()
+    index = _cached(data, "index")
+    if index is not None:
+        name_rows = [index.name_rows[name] for name in index.names_with_prefix(prefix)]
+        rows = np.sort(np.array([rows[0] for rows in name_rows if len(rows) == 1], dtype=np.intp))
+        return data.iloc[rows][["фио", "факультет", "курс"]]
+
+    names = parse_names(data)["имя"]
+    if name_counts is None:
+        name_counts = names.value_counts()
     unique_names = name_counts[name_counts == 1].index
-    result = starts_with_p[starts_with_p["имя"].isin(unique_names)]
+    unique_names = unique_names[unique_names.str.startswith(prefix)]
+    result = data[names.isin(unique_names)]
     result = result[["фио", "факультет", "курс"]]
     return result
 
 
 # Задача 8
-def highest_avg_grade_faculty(data: pd.DataFrame) -> Tuple[str, str, int]:
+@profiled(8)
+def highest_avg_grade_faculty(
+    data: pd.DataFrame, faculty_means: Optional[pd.Series] = None
+) -> Tuple[str, str, int]:
     """
     Находит факультет, на котором средний балл студентов третьего курса самый высокий.
     Определяет пол, средний балл котого выше.
     Сначала возвращает факультет, затем пол, затем балл.
+    Уже посчитанные средние баллы третьего курса по факультетам можно передать
+    в faculty_means.
     """
-    grade3 = data[data["курс"] == "3-й"].copy()
-    avg_facs = []
-    for faculty in grade3["факультет"].unique():
-        data_fac = grade3[grade3["факультет"] == faculty]
-        avg = data_fac["средний_балл"].mean()
-        avg_facs.append({"факультет": faculty, "средний_балл": avg})
-
-    avg_facs = pd.DataFrame(avg_facs).sort_values(by="средний_балл", ascending=False)
-    fac = avg_facs.iloc[0]["факультет"]
-
-    data_fac = grade3[grade3["факультет"] == fac].copy()
-    data_fac["отчество"] = data_fac["фио"].str.split().str[2]
-    male_patronymic_pattern = r".*(?:ович|евич|ич)$"
-    female_patronymic_pattern = r".*(?:овна|евна|ична|инична)$"
-    data_fac["пол_по_отчеству"] = None
-    data_fac.loc[
-        data_fac["отчество"].str.contains(male_patronymic_pattern, na=False),
-        "пол_по_отчеству",
-    ] = "male"
-    data_fac.loc[
-        data_fac["отчество"].str.contains(female_patronymic_pattern, na=False),
-        "пол_по_отчеству",
-    ] = "female"
-
-    avg_gender = []
-    for gender in data_fac["пол_по_отчеству"].unique():
-        data_fac_gender = data_fac[data_fac["пол_по_отчеству"] == gender]
-        avg = data_fac_gender["средний_балл"].mean()
-        avg_gender.append({"пол": gender, "средний_балл": avg})
-    avg_gender = pd.DataFrame(avg_gender).sort_values(
-        by="средний_балл", ascending=False
-    )
-    best_gender = avg_gender.iloc[0]["пол"]
-    best_grade = round(avg_gender.iloc[0]["средний_балл"])
+    grade3 = data["курс"] == "3-й"
+    if faculty_means is None:
+        faculty_means = (
+            data[grade3].groupby("факультет", sort=False, observed=True)["средний_балл"].mean()
+        )
+    fac = faculty_means.idxmax()
+
+    is_fac = grade3 & (data["факультет"] == fac)
+    genders = genders_by_patronym(parse_names(data)["отчество"][is_fac])
+    genders = genders[genders != "unknown"]
+    avg_gender = data.loc[genders.index, "средний_балл"].groupby(genders, observed=True).mean()
+    best_gender = avg_gender.idxmax()
+    best_grade = round(avg_gender.max())
 
     return (fac, best_gender, best_grade)
 
 
 # Задача 9
-def find_consecutive_students(data: pd.DataFrame) -> pd.DataFrame:
+def find_isu_runs(
+    isu, length: int = 5, limit: Optional[int] = None
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Находит первых 5 студентов, которым номера были присвоены подряд.
-    Выводит их ФИО, факультет, курс и номер группы.
+    Находит серии номеров ИСУ, присвоенных подряд, за один векторизованный проход
+    по отсортированному массиву уникальных номеров: соседние номера с разницей
+    больше единицы разбивают массив на сегменты.
+    Повторяющиеся номера учитываются один раз.
+    Возвращает начала серий и их длины (только серии длиной не меньше length)
+    в порядке возрастания номеров; если задан limit — только первые limit серий.
     """
+    values = np.sort(pd.Series(isu).dropna().to_numpy())
+    if values.size == 0:
+        return values, np.empty(0, dtype=np.intp)
 
-    data = data.sort_values(by="ису", ascending=True)
+    steps = np.diff(values)
+    values = values[np.concatenate(([True], steps != 0))]
+    breaks = np.flatnonzero(np.diff(values) != 1) + 1
+    first = np.concatenate(([0], breaks))
+    lengths = np.diff(np.concatenate((first, [values.size])))
+
+    long_enough = lengths >= length
+    starts, lengths = values[first[long_enough]], lengths[long_enough]
+    if limit is not None:
+        starts, lengths = starts[:limit], lengths[:limit]
+    return starts, lengths
 
-    def find_sequence(start_isu, depth):
-        if depth == 0:
-            return []
-        if (data["ису"] == start_isu).any():
-            sequence = find_sequence(start_isu + 1, depth - 1)
-            if sequence is not None:
-                return [int(start_isu)] + sequence
-        return None
 
-    for i in range(len(data)):
-        current_isu = data["ису"].iloc[i]
-        sequence = find_sequence(current_isu, 5)
-        if sequence:
-            consecutive_students = data[data["ису"].isin(sequence)]
-            return consecutive_students[
-                ["фио", "ису", "факультет", "курс", "группа"]
-            ].sort_values(by="ису")
+@profiled(9)
+def find_consecutive_students(data: pd.DataFrame, length: int = 5) -> pd.DataFrame:
+    """
+    Находит первых 5 студентов, которым номера были присвоены подряд.
+    Выводит их ФИО, факультет, курс и номер группы.
+    Длину серии можно изменить параметром length.
+    """
+    columns = ["фио", "ису", "факультет", "курс", "группа"]
+    index = _cached(data, "index")
+    isu = index.isu_sorted if index is not None else data["ису"]
+    starts, _ = find_isu_runs(isu, length, limit=1)
+    if starts.size == 0:
+        return data.iloc[:0][columns]
+
+    sequence = starts[0] + np.arange(length)
+    if index is not None:
+        return data.iloc[index.rows_with_isu(sequence)][columns]
+    consecutive_students = data[data["ису"].isin(sequence)]
+    return consecutive_students[columns].sort_values(by="ису")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,149 @@
+"""
+Генератор синтетических датасетов в формате isu_fake_data.csv.
+
+Факультеты и буквы их групп взяты из исходного датасета. Размеры факультетов
+убывают по закону Ципфа с показателем faculty_skew, у части студентов нет
+отчества (иностранные ФИО), у части — тюркские отчества с «оглы»/«кызы».
+Номера ИСУ занимают долю isu_density своего диапазона, так что подряд идущие
+номера встречаются тем чаще, чем выше плотность; доля duplicate_share строк
+получает номер, уже выданный другому студенту.
+
+Запуск: python datagen.py 1000000 students.csv [--seed 0]
+"""
+import argparse
+
+import numpy as np
+import pandas as pd
+
+FACULTIES = {
+    "факультет программной инженерии и компьютерной техники": "P",
+    "факультет информационных технологий и программирования": "M",
+    "факультет систем управления и робототехники": "R",
+    "факультет инфокоммуникационных технологий": "K",
+    "факультет безопасности информационных технологий": "N",
+    "факультет биотехнологий": "T",
+    "институт лазерных технологий": "L",
+    "физический факультет": "Z",
+    "научно-образовательный центр фотоники и оптоинформатики": "V",
+    "школа разработки видеоигр": "J",
+    "институт международного развития и партнерства": "D",
+}
+COURSES = {"1-й": 0.32, "2-й": 0.27, "3-й": 0.22, "4-й": 0.19}
+
+SURNAMES = [
+    "Иванов", "Смирнов", "Кузнецов", "Попов", "Васильев", "Петров", "Соколов", "Михайлов",
+    "Новиков", "Федоров", "Морозов", "Волков", "Алексеев", "Лебедев", "Семенов", "Егоров",
+    "Павлов", "Козлов", "Степанов", "Николаев", "Орлов", "Андреев", "Макаров", "Никитин",
+    "Захаров", "Зайцев", "Соловьев", "Борисов", "Яковлев", "Григорьев", "Романов", "Воробьев",
+    "Сергеев", "Кузьмин", "Фролов", "Александров", "Дмитриев", "Королев", "Гусев", "Киселев",
+    "Ильин", "Максимов", "Поляков", "Сорокин", "Виноградов", "Ковалев", "Белов", "Медведев",
+    "Антонов", "Тарасов", "Жуков", "Баранов", "Филиппов", "Комаров", "Давыдов", "Беляев",
+]
+MALE_NAMES = [
+    "Александр", "Дмитрий", "Максим", "Сергей", "Андрей", "Алексей", "Артем", "Илья",
+    "Кирилл", "Михаил", "Никита", "Матвей", "Роман", "Егор", "Арсений", "Иван", "Денис",
+    "Евгений", "Даниил", "Тимофей", "Владислав", "Игорь", "Павел", "Руслан", "Марк",
+    "Константин", "Тимур", "Олег", "Ярослав", "Антон", "Николай", "Глеб", "Пётр", "Платон",
+]
+FEMALE_NAMES = [
+    "Анастасия", "Мария", "Анна", "Виктория", "Екатерина", "Наталья", "Марина", "Полина",
+    "Софья", "Дарья", "Алиса", "Ксения", "Александра", "Елена", "Ольга", "Татьяна", "Юлия",
+    "Вероника", "Алина", "Валерия", "Ирина", "Елизавета", "Арина", "Варвара", "Пелагея",
+]
+FATHER_NAMES = [
+    "Александр", "Сергей", "Андрей", "Алексей", "Михаил", "Иван", "Денис", "Игорь", "Петр",
+    "Олег", "Антон", "Николай", "Владимир", "Виктор", "Дмитрий", "Константин", "Роман",
+    "Юрий", "Геннадий", "Борис", "Григорий", "Степан", "Федор", "Максим", "Валерий",
+]
+TURKIC_FATHER_NAMES = ["Тарлан", "Эльмар", "Рустам", "Анвар", "Фарход", "Ильхам", "Джовдат"]
+FOREIGN_NAMES = ["Туан", "Махмуд", "Хуан", "Давид", "Ахмад", "Линь", "Нгок", "Али", "Минь"]
+
+
+def _patronyms(fathers, suffix_male: str, suffix_female: str):
+    male, female = [], []
+    for father in fathers:
+        stem, vowel = (father[:-1], "е") if father.endswith("й") else (father, "о")
+        male.append(f"{stem}{vowel}{suffix_male}")
+        female.append(f"{stem}{vowel}{suffix_female}")
+    return np.array(male, dtype=object), np.array(female, dtype=object)
+
+
+def generate_students(
+    rows: int,
+    seed: int = 0,
+    faculty_skew: float = 1.0,
+    female_share: float = 0.3,
+    no_patronym_share: float = 0.12,
+    turkic_share: float = 0.005,
+    isu_density: float = 0.3,
+    duplicate_share: float = 0.05,
+    groups_per_course: int = 12,
+) -> pd.DataFrame:
+    """
+    Возвращает датасет из rows студентов со столбцами исходного CSV.
+    """
+    rng = np.random.default_rng(seed)
+
+    faculty_names = np.array(list(FACULTIES), dtype=object)
+    faculty_weights = 1 / np.arange(1, len(faculty_names) + 1) ** faculty_skew
+    faculty = rng.choice(len(faculty_names), rows, p=faculty_weights / faculty_weights.sum())
+    course_names = np.array(list(COURSES), dtype=object)
+    course = rng.choice(len(course_names), rows, p=list(COURSES.values()))
+
+    letters = np.array(list(FACULTIES.values()), dtype=object)
+    group_numbers = rng.integers(10, 10 + groups_per_course, rows).astype(str).astype(object)
+    group = letters[faculty] + "3" + (course + 1).astype(str).astype(object) + group_numbers
+
+    female = rng.random(rows) < female_share
+    surnames = np.array(SURNAMES, dtype=object)
+    surname = surnames[rng.integers(0, len(surnames), rows)]
+    surname = np.where(female, surname + "а", surname)
+    male_names = np.array(MALE_NAMES, dtype=object)
+    female_names = np.array(FEMALE_NAMES, dtype=object)
+    name = np.where(
+        female,
+        female_names[rng.integers(0, len(female_names), rows)],
+        male_names[rng.integers(0, len(male_names), rows)],
+    )
+
+    male_patronyms, female_patronyms = _patronyms(FATHER_NAMES, "вич", "вна")
+    father = rng.integers(0, len(FATHER_NAMES), rows)
+    patronym = " " + np.where(female, female_patronyms[father], male_patronyms[father])
+    turkic = np.array(TURKIC_FATHER_NAMES, dtype=object)
+    turkic = turkic[rng.integers(0, len(turkic), rows)]
+    kind = rng.random(rows)
+    is_turkic = kind < turkic_share
+    patronym = np.where(is_turkic, " " + turkic + np.where(female, " кызы", " оглы"), patronym)
+    is_foreign = (kind >= turkic_share) & (kind < turkic_share + no_patronym_share)
+    foreign = np.array(FOREIGN_NAMES, dtype=object)[rng.integers(0, len(FOREIGN_NAMES), rows)]
+    name = np.where(is_foreign, foreign, name)
+    patronym = np.where(is_foreign, "", patronym)
+    fio = surname + " " + name + patronym
+
+    isu = rng.choice(int(rows / isu_density) + 1, rows, replace=False) + 100000
+    duplicates = np.flatnonzero(rng.random(rows) < duplicate_share)
+    isu[duplicates] = isu[rng.integers(0, rows, duplicates.size)]
+
+    return pd.DataFrame(
+        {
+            "факультет": faculty_names[faculty],
+            "группа": group,
+            "курс": course_names[course],
+            "ису": isu,
+            "фио": fio,
+            "средний_балл": rng.integers(60, 101, rows),
+        }
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("rows", type=int)
+    parser.add_argument("output")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--faculty-skew", type=float, default=1.0)
+    parser.add_argument("--isu-density", type=float, default=0.3)
+    args = parser.parse_args()
+    generate_students(
+        args.rows, args.seed, faculty_skew=args.faculty_skew, isu_density=args.isu_density
+    ).to_csv(args.output, index=False)
@@ -0,0 +1,386 @@
+"""
+Инкрементальный отчет: состояние задач 1–9 обновляется пакетами изменений
+вместо пересчета по всему датасету.
+
+Студент определяется меткой строки в индексе датасета (номера ИСУ
+в данных повторяются). Каждая строка пакета обновляет счетчики по факультетам,
+курсам, группам и именам, суммы баллов по факультетам и полу, подсчет
+однофамильцев ФСУиР и отрезки подряд идущих номеров ИСУ, поэтому обновление
+стоит пропорционально размеру пакета. Запросы возвращают те же значения,
+что и функции cs102_pandas на текущем состоянии датасета: обновленные строки
+остаются на своих местах, новые добавляются в конец.
+"""
+import heapq
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from cs102_pandas import (
+    FSUIR,
+    course_statistics,
+    faculty_statistics,
+    genders_by_patronym,
+    parse_names,
+)
+
+
+class FirstPositions:
+    """
+    Наименьшая позиция строки для каждого ключа с ленивым удалением из кучи.
+    Нужна, чтобы упорядочивать факультеты по первому появлению, как groupby(sort=False).
+    """
+
+    def __init__(self):
+        self.heaps: Dict[Hashable, List[int]] = defaultdict(list)
+        self.removed: Dict[Hashable, Counter] = defaultdict(Counter)
+
+    def add(self, key: Hashable, position: int) -> None:
+        heapq.heappush(self.heaps[key], position)
+
+    def remove(self, key: Hashable, position: int) -> None:
+        self.removed[key][position] += 1
+
+    def first(self, key: Hashable) -> Optional[int]:
+        heap, removed = self.heaps[key], self.removed[key]
+        while heap and removed[heap[0]]:
+            removed[heapq.heappop(heap)] -= 1
+        return heap[0] if heap else None
+
+
+class IsuIntervals:
+    """
+    Отсортированные непересекающиеся отрезки присутствующих номеров ИСУ.
+    Номер может встречаться у нескольких студентов, поэтому хранится и кратность.
+    """
+
+    def __init__(self):
+        self.counts: Counter = Counter()
+        self.starts: List[int] = []
+        self.ends: List[int] = []
+
+    def add(self, isu: int) -> None:
+        self.counts[isu] += 1
+        if self.counts[isu] > 1:
+            return
+        i = bisect_right(self.starts, isu) - 1
+        joins_left = i >= 0 and self.ends[i] == isu - 1
+        joins_right = i + 1 < len(self.starts) and self.starts[i + 1] == isu + 1
+        if joins_left and joins_right:
+            self.ends[i] = self.ends.pop(i + 1)
+            del self.starts[i + 1]
+        elif joins_left:
+            self.ends[i] = isu
+        elif joins_right:
+            self.starts[i + 1] = isu
+        else:
+            self.starts.insert(i + 1, isu)
+            self.ends.insert(i + 1, isu)
+
+    def remove(self, isu: int) -> None:
+        self.counts[isu] -= 1
+        if self.counts[isu] > 0:
+            return
+        del self.counts[isu]
+        i = bisect_right(self.starts, isu) - 1
+        start, end = self.starts[i], self.ends[i]
+        if start == end:
+            del self.starts[i], self.ends[i]
+        elif isu == start:
+            self.starts[i] = isu + 1
+        elif isu == end:
+            self.ends[i] = isu - 1
+        else:
+            self.ends[i] = isu - 1
+            self.starts.insert(i + 1, isu + 1)
+            self.ends.insert(i + 1, end)
+
+    def first_run(self, length: int) -> Optional[range]:
+        for start, end in zip(self.starts, self.ends):
+            if end - start + 1 >= length:
+                return range(start, start + length)
+        return None
+
+
+def _change(counter: Counter, key: Hashable, delta) -> None:
+    counter[key] += delta
+    if not counter[key]:
+        del counter[key]
+
+
+class IncrementalReport:
+    """
+    Состояние отчета, которое обновляется методами add_students,
+    remove_students и update_students.
+    """
+
+    def __init__(self, data: pd.DataFrame):
+        self.columns = list(data.columns)
+        self.rows: Dict[Hashable, Tuple[int, tuple]] = {}
+        self.next_position = 0
+
+        self.faculty_counts: Counter = Counter()
+        self.faculty_first = FirstPositions()
+        self.course_faculty_counts: Counter = Counter()
+
+        self.fsuir_rows: Dict[Hashable, int] = {}
+        self.fsuir_groups: Counter = Counter()
+        self.fsuir_courses: Counter = Counter()
+        self.fsuir_no_patronym = 0
+        self.fsuir_genders: Counter = Counter()
+        self.surname_counts: Counter = Counter()
+        self.surname_groups: Dict[str, Counter] = defaultdict(Counter)
+        self.course_surname_counts: Counter = Counter()
+        self.namesakes_total = 0
+        self.namesakes_per_course: Counter = Counter()
+        self.namesake_groups: Counter = Counter()
+
+        self.name_counts: Counter = Counter()
+        self.name_groups: Dict[str, Counter] = defaultdict(Counter)
+        self.group_places: Dict[str, Counter] = defaultdict(Counter)
+        self.p_name_rows: Dict[str, Dict[Hashable, int]] = defaultdict(dict)
+
+        self.grade3_sums: Counter = Counter()
+        self.grade3_counts: Counter = Counter()
+        self.grade3_first = FirstPositions()
+        self.grade3_gender_sums: Counter = Counter()
+        self.grade3_gender_counts: Counter = Counter()
+
+        self.isu = IsuIntervals()
+        self.isu_rows: Dict[int, Dict[Hashable, int]] = defaultdict(dict)
+
+        self.add_students(data)
+
+    # Изменения
+
+    def add_students(self, students: pd.DataFrame) -> None:
+        """
+        Добавляет новых студентов в конец датасета. Метки строк должны быть новыми.
+        """
+        existing = [label for label in students.index if label in self.rows]
+        if existing or students.index.has_duplicates:
+            raise ValueError(f"Студенты уже есть в датасете: {existing}")
+        positions = range(self.next_position, self.next_position + len(students))
+        self.next_position += len(students)
+        self._apply(students, positions, 1)
+
+    def remove_students(self, labels: Iterable[Hashable]) -> None:
+        """
+        Удаляет студентов с указанными метками строк.
+        """
+        labels = list(labels)
+        self._check_known(labels)
+        positions = [self.rows[label][0] for label in labels]
+        old = pd.DataFrame(
+            [self.rows[label][1] for label in labels], index=labels, columns=self.columns
+        )
+        self._apply(old, positions, -1)
+
+    def update_students(self, students: pd.DataFrame) -> None:
+        """
+        Заменяет данные уже существующих студентов; строки остаются на своих местах.
+        """
+        self._check_known(students.index)
+        positions = [self.rows[label][0] for label in students.index]
+        self.remove_students(students.index)
+        self._apply(students[self.columns], positions, 1)
+
+    def _check_known(self, labels: Iterable[Hashable]) -> None:
+        missing = [label for label in labels if label not in self.rows]
+        if missing:
+            raise KeyError(f"Нет студентов с метками {missing}")
+
+    def _apply(self, students: pd.DataFrame, positions, sign: int) -> None:
+        names = parse_names(students)
+        genders = genders_by_patronym(names["отчество"])
+        records = students[self.columns].itertuples(index=False, name=None)
+        parts = zip(
+            students.index,
+            positions,
+            records,
+            students["факультет"],
+            students["группа"],
+            students["курс"],
+            students["ису"],
+            students["средний_балл"],
+            names["фамилия"],
+            names["имя"],
+            names["отчество"],
+            genders,
+        )
+        for (
+            label, position, record, faculty, group, course, isu, grade,
+            surname, name, patronym, gender,
+        ) in parts:
+            # строки без номера ИСУ в серии не входят, как и в find_isu_runs
+            has_isu = not pd.isna(isu)
+            if has_isu:
+                isu = int(isu)
+            if sign > 0:
+                self.rows[label] = (position, record)
+                self.faculty_first.add(faculty, position)
+                if has_isu:
+                    self.isu.add(isu)
+                    self.isu_rows[isu][label] = position
+            else:
+                del self.rows[label]
+                self.faculty_first.remove(faculty, position)
+                if has_isu:
+                    self.isu.remove(isu)
+                    del self.isu_rows[isu][label]
+
+            _change(self.faculty_counts, faculty, sign)
+            _change(self.course_faculty_counts, (course, faculty), sign)
+
+            # строки без имени не входят в частоты имен, как и в value_counts
+            if not pd.isna(name):
+                _change(self.name_counts, name, sign)
+                _change(self.name_groups[name], group, sign)
+            _change(self.group_places[group], (faculty, course), sign)
+            if isinstance(name, str) and name.startswith("П"):
+                if sign > 0:
+                    self.p_name_rows[name][label] = position
+                else:
+                    del self.p_name_rows[name][label]
+
+            if course == "3-й":
+                if sign > 0:
+                    self.grade3_first.add(faculty, position)
+                else:
+                    self.grade3_first.remove(faculty, position)
+                if not pd.isna(grade):
+                    _change(self.grade3_sums, faculty, sign * grade)
+                    _change(self.grade3_counts, faculty, sign)
+                    if gender != "unknown":
+                        _change(self.grade3_gender_sums, (faculty, gender), sign * grade)
+                        _change(self.grade3_gender_counts, (faculty, gender), sign)
+
+            if faculty == FSUIR:
+                if sign > 0:
+                    self.fsuir_rows[label] = position
+                else:
+                    del self.fsuir_rows[label]
+                self._apply_fsuir(group, course, surname, patronym, gender, sign)
+
+    def _apply_fsuir(self, group, course, surname, patronym, gender, sign: int) -> None:
+        _change(self.fsuir_groups, group, sign)
+        _change(self.fsuir_courses, course, sign)
+        self.fsuir_no_patronym += sign * pd.isna(patronym)
+        _change(self.fsuir_genders, gender, sign)
+        if pd.isna(surname):
+            # без фамилии студент ни с кем не считается однофамильцем
+            return
+
+        # однофамильцы: при переходе фамилии через порог 2 в подсчет входят
+        # или выходят сразу обе строки, иначе меняется только текущая
+        if sign > 0:
+            _change(self.surname_groups[surname], group, 1)
+        count = self.surname_counts[surname] + sign
+        if count == 2 and sign > 0 or count == 1 and sign < 0:
+            self.namesakes_total += 2 * sign
+            for namesake_group, n in self.surname_groups[surname].items():
+                _change(self.namesake_groups, namesake_group, sign * n)
+        elif count >= 2:
+            self.namesakes_total += sign
+            _change(self.namesake_groups, group, sign)
+        _change(self.surname_counts, surname, sign)
+        if sign < 0:
+            _change(self.surname_groups[surname], group, -1)
+
+        course_count = self.course_surname_counts[(course, surname)] + sign
+        if course_count == 2 and sign > 0 or course_count == 1 and sign < 0:
+            self.namesakes_per_course[course] += 2 * sign
+        elif course_count >= 2:
+            self.namesakes_per_course[course] += sign
+        _change(self.course_surname_counts, (course, surname), sign)
+
+    # Запросы
+
+    def _frame(self, labels: Iterable[Hashable], columns: List[str]) -> pd.DataFrame:
+        labels = sorted(labels, key=lambda label: self.rows[label][0])
+        frame = pd.DataFrame(
+            [self.rows[label][1] for label in labels], index=labels, columns=self.columns
+        )
+        return frame[columns]
+
+    def filter_fsuir_students(self) -> Tuple[int, int, pd.DataFrame]:
+        data_fsuir = self._frame(self.fsuir_rows, self.columns)
+        return (len(self.fsuir_rows), len(self.fsuir_groups), data_fsuir)
+
+    def find_homonymous_students(self) -> Tuple[bool, int, pd.Series, str]:
+        courses = sorted(
+            self.fsuir_courses, key=lambda course: int("".join(filter(str.isdigit, course)))
+        )
+        homonyms_per_course = pd.Series(
+            {course: self.namesakes_per_course[course] for course in courses}
+        )
+        most = max(self.namesake_groups.values(), default=0)
+        max_group = min(group for group, n in self.namesake_groups.items() if n == most)
+        return (True, self.namesakes_total, homonyms_per_course, max_group)
+
+    def analyze_patronyms(self) -> Tuple[int, pd.Series]:
+        gender_counts = {
+            "male": self.fsuir_genders["male"],
+            "female": self.fsuir_genders["female"],
+        }
+        return (self.fsuir_no_patronym, pd.Series(gender_counts))
+
+    def faculty_statistics(self):
+        faculties = sorted(self.faculty_counts, key=self.faculty_first.first)
+        counts = pd.Series([self.faculty_counts[faculty] for faculty in faculties], index=faculties)
+        return faculty_statistics(None, counts)
+
+    def course_statistics(self) -> Tuple[pd.Series, pd.Series]:
+        counts = pd.Series(self.course_faculty_counts)
+        counts.index.names = ["курс", "факультет"]
+        return course_statistics(None, counts)
+
+    def most_popular_name(self) -> Tuple[str, str, str, str, float]:
+        popular_name, count = max(self.name_counts.items(), key=lambda item: item[1])
+        name_groups = self.name_groups[popular_name]
+        name_group = max(name_groups, key=name_groups.get)
+        faculty, course = next(iter(self.group_places[name_group]))
+        name_ratio = round(count / len(self.rows), 2)
+        return (popular_name, name_group, faculty, course, name_ratio)
+
+    def find_students_with_name_starting_P(self) -> pd.DataFrame:
+        labels = [
+            label
+            for name, rows in self.p_name_rows.items()
+            if self.name_counts[name] == 1
+            for label in rows
+        ]
+        return self._frame(labels, ["фио", "факультет", "курс"])
+
+    @staticmethod
+    def _mean(sums: Counter, counts: Counter, key: Hashable) -> float:
+        return sums[key] / counts[key] if counts[key] else np.nan
+
+    def highest_avg_grade_faculty(self) -> Tuple[str, str, int]:
+        first = self.grade3_first.first
+        faculties = sorted(
+            (faculty for faculty in self.faculty_counts if first(faculty) is not None), key=first
+        )
+        faculty_means = pd.Series(
+            [self._mean(self.grade3_sums, self.grade3_counts, faculty) for faculty in faculties],
+            index=faculties,
+            dtype=float,
+        )
+        fac = faculty_means.idxmax()
+        sums, counts = self.grade3_gender_sums, self.grade3_gender_counts
+        avg_gender = pd.Series(
+            {
+                gender: self._mean(sums, counts, (fac, gender))
+                for gender in ["male", "female"]
+                if counts[(fac, gender)]
+            }
+        )
+        return (fac, avg_gender.idxmax(), round(avg_gender.max()))
+
+    def find_consecutive_students(self, length: int = 5) -> pd.DataFrame:
+        sequence = self.isu.first_run(length) or []
+        labels = [label for isu in sequence for label in self.isu_rows[isu]]
+        frame = self._frame(labels, ["фио", "ису", "факультет", "курс", "группа"])
+        return frame.sort_values(by="ису", kind="stable")
@@ -0,0 +1,139 @@
+"""
+Нагрузочный тест server.py: clients одновременных клиентов, каждый со своим
+постоянным соединением, отправляют по requests запросов из списка путей.
+Выводит JSON с числом запросов и ошибок, пропускной способностью и задержками
+p50, p90, p99 и максимальной в миллисекундах.
+
+С --spawn сервер запускается отдельным процессом на время теста.
+
+Запуск: python load_test.py [--clients 32] [--requests 50] [--spawn isu_fake_data.csv]
+"""
+import argparse
+import asyncio
+import json
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+from urllib.parse import quote
+
+import numpy as np
+
+DEFAULT_PATHS = [
+    *(f"/tasks/{task}" for task in range(1, 10)),
+    "/tasks/1?faculty=" + quote("физический факультет"),
+    "/tasks/4?course=" + quote("3-й"),
+    "/tasks/7?prefix=" + quote("А"),
+    "/tasks/9?length=3",
+]
+
+
+async def request(
+    reader: asyncio.StreamReader, writer: asyncio.StreamWriter, host: str, path: str
+) -> int:
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode("latin-1"))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    await reader.readexactly(length)
+    return status
+
+
+async def client(
+    host: str, port: int, paths: List[str], offset: int, count: int
+) -> List[Tuple[float, int]]:
+    reader, writer = await asyncio.open_connection(host, port)
+    results = []
+    try:
+        for number in range(count):
+            path = paths[(offset + number) % len(paths)]
+            start = time.perf_counter()
+            status = await request(reader, writer, host, path)
+            results.append((time.perf_counter() - start, status))
+    finally:
+        writer.close()
+    return results
+
+
+async def wait_for_server(host: str, port: int, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            reader, writer = await asyncio.open_connection(host, port)
+        except OSError:
+            if time.monotonic() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+            continue
+        await request(reader, writer, host, "/health")
+        writer.close()
+        return
+
+
+async def load_test(host: str, port: int, clients: int, requests: int, paths: List[str]) -> dict:
+    start = time.perf_counter()
+    runs = await asyncio.gather(
+        *(client(host, port, paths, offset, requests) for offset in range(clients))
+    )
+    elapsed = time.perf_counter() - start
+
+    latencies = np.array([latency for run in runs for latency, _ in run]) * 1000
+    errors = sum(status != 200 for run in runs for _, status in run)
+    p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+    return {
+        "clients": clients,
+        "requests": int(latencies.size),
+        "errors": int(errors),
+        "seconds": elapsed,
+        "requests_per_second": latencies.size / elapsed,
+        "p50_ms": p50,
+        "p90_ms": p90,
+        "p99_ms": p99,
+        "max_ms": float(latencies.max()),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8102)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--requests", type=int, default=50, help="запросов на клиента")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS)
+    parser.add_argument("--spawn", metavar="CSV", help="запустить server.py с этим датасетом")
+    parser.add_argument("--workers", type=int, default=4, help="процессов сервера для --spawn")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        server = subprocess.Popen(
+            [
+                sys.executable,
+                "server.py",
+                args.spawn,
+                f"--port={args.port}",
+                f"--workers={args.workers}",
+            ],
+            stdout=subprocess.DEVNULL,
+        )
+    try:
+        asyncio.run(wait_for_server(args.host, args.port, timeout=60))
+        summary = asyncio.run(
+            load_test(args.host, args.port, args.clients, args.requests, args.paths)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Параллельный расчет сводок по факультетам для задач 4, 5 и 8.
+
+Датасет делится на workers непрерывных диапазонов строк. Каждый процесс
+ProcessPoolExecutor сам группирует свой диапазон по парам (курс, факультет)
+и возвращает небольшую таблицу: число строк, сумму и число баллов по каждой
+паре. Основной процесс не разбирает строки датасета, а только складывает
+частичные таблицы в порядке диапазонов, поэтому пары остаются в порядке
+первого появления — как в последовательном расчете в report.py.
+
+Нужные столбцы передаются процессам один раз, через initializer. Процессы
+всегда запускаются через fork, поэтому столбцы достаются им без копирования
+через pickle. Там, где fork нет (Windows), сводки считаются в текущем процессе.
+"""
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.context import BaseContext
+from typing import Dict, NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+
+COLUMNS = ["курс", "факультет", "средний_балл"]
+
+
+class FacultyAggregates(NamedTuple):
+    faculty_counts: pd.Series
+    course_faculty_counts: pd.Series
+    grade3_faculty_means: pd.Series
+
+
+_columns: Optional[Dict[str, pd.Series]] = None
+
+
+def fork_context() -> Optional[BaseContext]:
+    """
+    Контекст запуска процессов через fork или None, если платформа его не поддерживает.
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("fork")
+    return None
+
+
+def _init_worker(columns: Dict[str, pd.Series]) -> None:
+    global _columns
+    _columns = columns
+
+
+def _aggregate_rows(start: int, stop: int) -> pd.DataFrame:
+    """
+    Выполняется в рабочем процессе: размер, сумма и число баллов
+    по парам (курс, факультет) в строках [start, stop).
+    """
+    return _aggregate(_columns, start, stop)
+
+
+def _aggregate(columns: Dict[str, pd.Series], start: int, stop: int) -> pd.DataFrame:
+    chunk = pd.DataFrame({name: column.iloc[start:stop] for name, column in columns.items()})
+    return chunk.groupby(["курс", "факультет"], sort=False, observed=True)["средний_балл"].agg(
+        ["size", "sum", "count"]
+    )
+
+
+def faculty_aggregates(data: pd.DataFrame, workers: int = 4) -> FacultyAggregates:
+    """
+    Считает в workers процессах число студентов по факультетам, по парам
+    (курс, факультет) и средние баллы третьего курса по факультетам.
+    Порядок и значения серий совпадают с последовательным расчетом.
+    """
+    bounds = np.linspace(0, len(data), workers + 1).astype(int)
+    ranges = [(start, stop) for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+    ranges = ranges or [(0, 0)]
+    columns = {name: data[name] for name in COLUMNS}
+    context = fork_context()
+    if context is None:
+        # без fork initializer копировал бы столбцы в каждый процесс через pickle
+        parts = [_aggregate(columns, 0, len(data))]
+    else:
+        with ProcessPoolExecutor(
+            len(ranges), mp_context=context, initializer=_init_worker, initargs=(columns,)
+        ) as pool:
+            parts = list(pool.map(_aggregate_rows, *zip(*ranges)))
+
+    # частичные таблицы идут в порядке диапазонов, поэтому sort=False
+    # сохраняет порядок первого появления пар во всем датасете
+    merged = pd.concat(parts).groupby(level=[0, 1], sort=False, observed=True).sum()
+    course_faculty_counts = merged["size"]
+    faculty_counts = course_faculty_counts.groupby(
+        level="факультет", sort=False, observed=True
+    ).sum()
+
+    is_grade3 = merged.index.get_level_values("курс") == "3-й"
+    grade3 = merged[is_grade3].droplevel("курс")
+    grade3_faculty_means = (grade3["sum"] / grade3["count"].where(grade3["count"] > 0)).rename(
+        "mean"
+    )
+    return FacultyAggregates(faculty_counts, course_faculty_counts, grade3_faculty_means)
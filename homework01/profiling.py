@@ -0,0 +1,187 @@
+"""
+Профилирование задач cs102_pandas.
+
+Функции задач помечены декоратором profiled. Пока профилирование выключено,
+декоратор только проверяет один флаг и вызывает функцию. Внутри контекста
+profiling(...) для каждого вызова задачи записываются:
+ - wall_seconds и cpu_seconds — время по часам и процессорное время
+ - rows_scanned — сколько строк во входных таблицах и сериях
+ - frames_created и series_created — сколько DataFrame и Series создано за вызов
+ - peak_bytes — пик памяти сверх занятой до вызова (по tracemalloc, если memory=True)
+
+Записи можно сохранить в JSON, а с cprofile_path весь контекст дополнительно
+профилируется cProfile; файл .prof открывается в snakeviz или превращается
+во flamegraph через flameprof.
+
+Пример:
+    with profiling(cprofile_path="report.prof") as profiler:
+        build_report(data)
+    profiler.dump_json("profile.json")
+"""
+import cProfile
+import json
+import time
+import tracemalloc
+from contextlib import contextmanager
+from functools import wraps
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import pandas as pd
+from pandas.core.generic import NDFrame
+
+
+class TaskProfiler:
+    """
+    Собирает записи о вызовах задач. Одновременно активен не больше одного профайлера.
+    """
+
+    def __init__(self, memory: bool = True):
+        self.memory = memory
+        self.records: List[Dict[str, Any]] = []
+        self._stack: List[Dict[str, Any]] = []
+        self._created = {pd.DataFrame: 0, pd.Series: 0}
+
+    def _count_created(self, original_init: Callable) -> Callable:
+        created = self._created
+
+        @wraps(original_init)
+        def init(obj, *args, **kwargs):
+            original_init(obj, *args, **kwargs)
+            kind = type(obj)
+            if kind in created:
+                created[kind] += 1
+
+        return init
+
+    def _peak(self) -> int:
+        # пик с прошлого сброса; после чтения счетчик сбрасывается к текущему значению
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.reset_peak()
+        return peak
+
+    def call(self, task: int, func: Callable, args: tuple, kwargs: dict) -> Any:
+        if self.memory and self._stack:
+            self._stack[-1]["peak"] = max(self._stack[-1]["peak"], self._peak())
+        frame = {
+            "peak": 0,
+            "memory": tracemalloc.get_traced_memory()[0] if self.memory else 0,
+            "frames": self._created[pd.DataFrame],
+            "series": self._created[pd.Series],
+        }
+        if self.memory:
+            tracemalloc.reset_peak()
+        self._stack.append(frame)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            cpu = time.process_time() - cpu
+            wall = time.perf_counter() - wall
+            self._stack.pop()
+            peak = max(frame["peak"], self._peak()) if self.memory else 0
+            if self.memory and self._stack:
+                self._stack[-1]["peak"] = max(self._stack[-1]["peak"], peak)
+            self.records.append(
+                {
+                    "task": task,
+                    "function": func.__name__,
+                    "wall_seconds": wall,
+                    "cpu_seconds": cpu,
+                    "rows_scanned": sum(
+                        len(value)
+                        for value in (*args, *kwargs.values())
+                        if isinstance(value, (pd.DataFrame, pd.Series))
+                    ),
+                    "frames_created": self._created[pd.DataFrame] - frame["frames"],
+                    "series_created": self._created[pd.Series] - frame["series"],
+                    "peak_bytes": max(peak - frame["memory"], 0) if self.memory else None,
+                }
+            )
+
+    def summary(self) -> Dict[int, Dict[str, Any]]:
+        """
+        Сумма по каждой задаче; пик памяти — наибольший из вызовов.
+        """
+        tasks: Dict[int, Dict[str, Any]] = {}
+        for record in self.records:
+            total = tasks.setdefault(
+                record["task"],
+                {
+                    "function": record["function"],
+                    "calls": 0,
+                    "wall_seconds": 0.0,
+                    "cpu_seconds": 0.0,
+                    "rows_scanned": 0,
+                    "frames_created": 0,
+                    "series_created": 0,
+                    "peak_bytes": record["peak_bytes"],
+                },
+            )
+            total["calls"] += 1
+            for key in [
+                "wall_seconds", "cpu_seconds", "rows_scanned", "frames_created", "series_created"
+            ]:
+                total[key] += record[key]
+            if record["peak_bytes"] is not None:
+                total["peak_bytes"] = max(total["peak_bytes"], record["peak_bytes"])
+        return dict(sorted(tasks.items()))
+
+    def dump_json(self, path: str) -> None:
+        with open(path, "w", encoding="utf-8") as file:
+            json.dump(
+                {"tasks": self.summary(), "calls": self.records}, file, ensure_ascii=False, indent=2
+            )
+
+
+_active: Optional[TaskProfiler] = None
+
+
+def profiled(task: int) -> Callable[[Callable], Callable]:
+    """
+    Помечает функцию как задачу task: ее вызовы записываются активным профайлером.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if _active is None:
+                return func(*args, **kwargs)
+            return _active.call(task, func, args, kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def profiling(memory: bool = True, cprofile_path: Optional[str] = None) -> Iterator[TaskProfiler]:
+    """
+    Включает запись вызовов задач на время контекста и возвращает профайлер.
+    memory=False отключает tracemalloc, который заметно замедляет код.
+    С cprofile_path весь контекст профилируется cProfile, статистика
+    сохраняется в этот файл.
+    """
+    global _active
+    if _active is not None:
+        raise RuntimeError("профилирование уже включено")
+
+    profiler = TaskProfiler(memory)
+    original_init = NDFrame.__init__
+    NDFrame.__init__ = profiler._count_created(original_init)
+    started_tracemalloc = memory and not tracemalloc.is_tracing()
+    if started_tracemalloc:
+        tracemalloc.start()
+    profile = cProfile.Profile() if cprofile_path else None
+    _active = profiler
+    try:
+        if profile is not None:
+            profile.enable()
+        yield profiler
+    finally:
+        if profile is not None:
+            profile.disable()
+            profile.dump_stats(cprofile_path)
+        _active = None
+        if started_tracemalloc:
+            tracemalloc.stop()
+        NDFrame.__init__ = original_init
@@ -0,0 +1,171 @@
+"""
+Отчет по задачам 1–9 за минимальное число проходов по датасету.
+
+Задачи делят между собой промежуточные результаты: разбор ФИО, подвыборку ФСУиР,
+одну группировку по парам (курс, факультет) для задач 4, 5 и 8 и частоту имен
+для задач 6 и 7. Каждый промежуточный результат считается не больше одного раза
+и только если он нужен одной из запрошенных задач.
+
+Запуск: python report.py [путь_к_csv] [--workers 4] [--profile profile.json]
+                        [--cprofile report.prof]
+"""
+import argparse
+import json
+import sys
+from functools import cached_property
+from typing import Any, Dict, Iterable, Optional
+
+import pandas as pd
+
+from cs102_pandas import (
+    analyze_patronyms,
+    build_index,
+    course_statistics,
+    faculty_statistics,
+    filter_fsuir_students,
+    find_consecutive_students,
+    find_homonymous_students,
+    find_students_with_name_starting_P,
+    highest_avg_grade_faculty,
+    most_popular_name,
+    parse_names,
+)
+from parallel import FacultyAggregates, faculty_aggregates
+from profiling import profiling
+
+TASKS = range(1, 10)
+
+
+class SharedAggregates:
+    """
+    Общие промежуточные результаты задач, вычисляемые по первому обращению.
+    Если задано число процессов workers, сводки по факультетам для задач 4, 5 и 8
+    считаются параллельно (см. parallel.py).
+    """
+
+    def __init__(
+        self, data: pd.DataFrame, tasks: Iterable[int] = TASKS, workers: Optional[int] = None
+    ):
+        self.data = data
+        self.tasks = set(tasks)
+        self.workers = workers
+
+    @cached_property
+    def fsuir(self) -> tuple:
+        if self.tasks & {6, 7, 8}:
+            # ФИО все равно будут разобраны целиком — подвыборка возьмет их из кэша
+            parse_names(self.data)
+        return filter_fsuir_students(self.data)
+
+    @cached_property
+    def course_faculty(self) -> pd.DataFrame:
+        return self.data.groupby(["курс", "факультет"], sort=False, observed=True)[
+            "средний_балл"
+        ].agg(["size", "mean"])
+
+    @cached_property
+    def parallel(self) -> FacultyAggregates:
+        return faculty_aggregates(self.data, self.workers)
+
+    @cached_property
+    def faculty_counts(self) -> pd.Series:
+        if self.workers:
+            return self.parallel.faculty_counts
+        return (
+            self.course_faculty["size"].groupby(level="факультет", sort=False, observed=True).sum()
+        )
+
+    @cached_property
+    def course_faculty_counts(self) -> pd.Series:
+        if self.workers:
+            return self.parallel.course_faculty_counts
+        return self.course_faculty["size"]
+
+    @cached_property
+    def grade3_faculty_means(self) -> pd.Series:
+        if self.workers:
+            return self.parallel.grade3_faculty_means
+        course_faculty = self.course_faculty
+        is_grade3 = course_faculty.index.get_level_values("курс") == "3-й"
+        return course_faculty.loc[is_grade3, "mean"].droplevel("курс")
+
+    @cached_property
+    def name_counts(self) -> pd.Series:
+        return parse_names(self.data)["имя"].value_counts()
+
+
+def build_report(
+    data: pd.DataFrame,
+    tasks: Iterable[int] = TASKS,
+    workers: Optional[int] = None,
+    index: bool = False,
+) -> Dict[int, Any]:
+    """
+    Выполняет запрошенные задачи, разделяя между ними общие вычисления.
+    Возвращает словарь «номер задачи -> результат» с теми же значениями,
+    что и соответствующие функции cs102_pandas.
+    workers — число процессов для сводок по факультетам; по умолчанию
+    все считается в текущем процессе.
+    index — построить для датасета индексы StudentIndex (см. build_index),
+    которыми пользуются задачи 1, 6, 7 и 9. Индексы запоминаются вместе
+    с датасетом, поэтому это выгодно, если тот же датасет используется дальше.
+    """
+    tasks = list(tasks)
+    if index and set(tasks) & {1, 6, 7, 9}:
+        build_index(data)
+    shared = SharedAggregates(data, tasks, workers)
+    runners = {
+        1: lambda: shared.fsuir,
+        2: lambda: find_homonymous_students(shared.fsuir[2]),
+        3: lambda: analyze_patronyms(shared.fsuir[2]),
+        4: lambda: faculty_statistics(data, shared.faculty_counts),
+        5: lambda: course_statistics(data, shared.course_faculty_counts),
+        6: lambda: most_popular_name(data, shared.name_counts),
+        7: lambda: find_students_with_name_starting_P(data, shared.name_counts),
+        8: lambda: highest_avg_grade_faculty(data, shared.grade3_faculty_means),
+        9: lambda: find_consecutive_students(data),
+    }
+    return {task: runners[task]() for task in tasks}
+
+
+def print_report(report: Dict[int, Any]) -> None:
+    for task, result in report.items():
+        print(f"Задача {task}:")
+        print(result)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", nargs="?", default="isu_fake_data.csv")
+    parser.add_argument(
+        "--profile", help="записать разбивку по задачам в JSON-файл (\"-\" — в stderr)"
+    )
+    parser.add_argument("--cprofile", help="сохранить статистику cProfile в файл")
+    parser.add_argument(
+        "--no-memory", action="store_true", help="не замерять пик памяти через tracemalloc"
+    )
+    parser.add_argument(
+        "--index", action="store_true", help="построить индексы датасета для задач 1, 6, 7 и 9"
+    )
+    parser.add_argument(
+        "--workers", type=int, help="число процессов для сводок по факультетам (задачи 4, 5, 8)"
+    )
+    args = parser.parse_args()
+
+    data = pd.read_csv(args.path)
+    if not (args.profile or args.cprofile):
+        print_report(build_report(data, workers=args.workers, index=args.index))
+        return
+
+    with profiling(memory=not args.no_memory, cprofile_path=args.cprofile) as profiler:
+        report = build_report(data, workers=args.workers, index=args.index)
+    print_report(report)
+    if args.profile == "-":
+        json.dump(profiler.summary(), sys.stderr, ensure_ascii=False, indent=2)
+        print(file=sys.stderr)
+    elif args.profile:
+        profiler.dump_json(args.profile)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+Кэш результатов функций задач с ключом по отпечатку содержимого датасета.
+
+Отпечаток — хэш BLAKE2 от pd.util.hash_pandas_object, названий и типов
+столбцов, поэтому два датасета с одинаковым содержимым делят записи кэша,
+а на диске ключи совпадают между запусками. Хэш считается за один проход
+и запоминается для объекта датасета вместе с его индексом, столбцами
+и массивами блоков: замена, добавление или удаление столбца меняет эти
+массивы, и при следующем вызове отпечаток считается заново. Запись значений
+на месте (data.loc[...] = ...) массивы не меняет — после нее нужно вызвать
+invalidate(data) или создавать кэш с verify=True.
+
+Результаты хранятся в LRU в памяти с ограничением по байтам и, если задана
+папка disk_dir, в pickle-файлах на диске. Каждый вызов возвращает копию
+результата, так что изменения возвращенных таблиц не портят кэш.
+
+Пример:
+    cache = ResultCache(disk_dir=".cs102_cache/results")
+    faculty_counts, max_faculty, min_faculty = cache.call(faculty_statistics, data)
+"""
+import copy
+import hashlib
+import os
+import pickle
+import re
+import sys
+import weakref
+from collections import OrderedDict
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import pandas as pd
+
+PandasObject = Union[pd.DataFrame, pd.Series]
+
+_fingerprints: Dict[int, Tuple[weakref.ref, tuple, str]] = {}
+
+
+def _signature(data: PandasObject) -> tuple:
+    columns = data.columns if isinstance(data, pd.DataFrame) else data.name
+    return (data.index, columns, *data._mgr.arrays)
+
+
+def _same_signature(left: tuple, right: tuple) -> bool:
+    return len(left) == len(right) and all(a is b for a, b in zip(left, right))
+
+
+def content_fingerprint(data: PandasObject) -> str:
+    """
+    Хэш содержимого таблицы или серии без запоминания.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr([(str(c), str(t)) for c, t in data.dtypes.items()]).encode())
+    else:
+        digest.update(repr((str(data.name), str(data.dtype))).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+def dataset_fingerprint(data: PandasObject) -> str:
+    """
+    Отпечаток содержимого, запомненный для объекта data, пока у него те же
+    индекс, столбцы и массивы блоков.
+    """
+    signature = _signature(data)
+    entry = _fingerprints.get(id(data))
+    if entry is not None and entry[0]() is data and _same_signature(entry[1], signature):
+        return entry[2]
+    if entry is None:
+        weakref.finalize(data, _fingerprints.pop, id(data), None)
+    fingerprint = content_fingerprint(data)
+    _fingerprints[id(data)] = (weakref.ref(data), signature, fingerprint)
+    return fingerprint
+
+
+def forget_fingerprint(data: PandasObject) -> None:
+    entry = _fingerprints.get(id(data))
+    if entry is not None and entry[0]() is data:
+        _fingerprints[id(data)] = (entry[0], (), entry[2])
+
+
+def _function_name(func: Callable) -> str:
+    return f"{func.__module__}.{func.__qualname__}"
+
+
+def _file_name(name: str) -> str:
+    return re.sub(r"[^\w.*]", "_", name)
+
+
+def _argument_key(value: Any) -> Any:
+    # списки, словари и множества приводятся к кортежам: ключ должен хэшироваться,
+    # а порядок элементов множеств и словарей — не зависеть от запуска (имя файла на диске)
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return ("pandas", dataset_fingerprint(value))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_argument_key(item) for item in value))
+    if isinstance(value, dict):
+        items = ((_argument_key(key), _argument_key(item)) for key, item in value.items())
+        return ("dict", tuple(sorted(items, key=repr)))
+    if isinstance(value, (set, frozenset)):
+        return ("set", tuple(sorted((_argument_key(item) for item in value), key=repr)))
+    return value
+
+
+def _size(value: Any) -> int:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        usage = value.memory_usage(deep=True, index=True)
+        return int(usage.sum() if isinstance(value, pd.DataFrame) else usage)
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(_size(item) for item in value)
+    return sys.getsizeof(value)
+
+
+class ResultCache:
+    """
+    Двухуровневый кэш результатов: LRU в памяти до max_bytes байт
+    и необязательная папка disk_dir до disk_max_bytes байт.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = 64 * 2**20,
+        disk_dir: Optional[str] = None,
+        disk_max_bytes: int = 2**30,
+        verify: bool = False,
+    ):
+        self.max_bytes = max_bytes
+        self.disk_dir = Path(disk_dir) if disk_dir is not None else None
+        self.disk_max_bytes = disk_max_bytes
+        self.verify = verify
+        self.memory: "OrderedDict[tuple, Tuple[Any, int]]" = OrderedDict()
+        self.memory_bytes = 0
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0}
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    def _key(self, func: Callable, data: PandasObject, args: tuple, kwargs: dict) -> tuple:
+        fingerprint = content_fingerprint(data) if self.verify else dataset_fingerprint(data)
+        return (
+            fingerprint,
+            _function_name(func),
+            tuple(_argument_key(arg) for arg in args),
+            tuple(sorted((name, _argument_key(arg)) for name, arg in kwargs.items())),
+        )
+
+    def _disk_path(self, key: tuple) -> Path:
+        digest = hashlib.blake2b(pickle.dumps(key[2:]), digest_size=8).hexdigest()
+        return self.disk_dir / f"{key[0]}-{_file_name(key[1])}-{digest}.pkl"
+
+    def _store(self, key: tuple, result: Any) -> None:
+        size = _size(result)
+        if size > self.max_bytes:
+            return
+        self.memory[key] = (result, size)
+        self.memory_bytes += size
+        while self.memory_bytes > self.max_bytes:
+            _, (_, evicted) = self.memory.popitem(last=False)
+            self.memory_bytes -= evicted
+
+    def _store_disk(self, key: tuple, result: Any) -> None:
+        path = self._disk_path(key)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temporary, "wb") as file:
+            pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temporary, path)
+
+        files = sorted(self.disk_dir.glob("*.pkl"), key=lambda file: file.stat().st_mtime_ns)
+        total = sum(file.stat().st_size for file in files)
+        for file in files:
+            if total <= self.disk_max_bytes:
+                break
+            total -= file.stat().st_size
+            file.unlink(missing_ok=True)
+
+    def call(self, func: Callable, data: PandasObject, *args, **kwargs) -> Any:
+        """
+        Возвращает копию результата func(data, *args, **kwargs) из кэша
+        или вычисляет и запоминает его.
+        """
+        key = self._key(func, data, args, kwargs)
+        entry = self.memory.get(key)
+        if entry is not None:
+            self.memory.move_to_end(key)
+            self.stats["hits"] += 1
+            return copy.deepcopy(entry[0])
+
+        if self.disk_dir is not None:
+            path = self._disk_path(key)
+            if path.exists():
+                with open(path, "rb") as file:
+                    result = pickle.load(file)
+                self.stats["disk_hits"] += 1
+                self._store(key, result)
+                return copy.deepcopy(result)
+
+        self.stats["misses"] += 1
+        signature = _signature(data)
+        result = func(data, *args, **kwargs)
+        if not _same_signature(signature, _signature(data)):
+            # функция изменила датасет: результат относится к прежнему содержимому,
+            # а отпечаток нового содержимого будет посчитан заново
+            forget_fingerprint(data)
+        self._store(key, copy.deepcopy(result))
+        if self.disk_dir is not None:
+            self._store_disk(key, result)
+        return result
+
+    def wrap(self, func: Callable) -> Callable:
+        """
+        Функция с той же сигнатурой, что и func, с результатами из этого кэша.
+        """
+
+        @wraps(func)
+        def wrapper(data, *args, **kwargs):
+            return self.call(func, data, *args, **kwargs)
+
+        return wrapper
+
+    def invalidate(self, data: Optional[PandasObject] = None, func: Optional[Callable] = None):
+        """
+        Удаляет записи для датасета data и (или) функции func; без аргументов —
+        все записи, в том числе на диске. Отпечаток data при этом считается заново,
+        так что после записи значений на месте кэш снова соответствует содержимому.
+        """
+        fingerprints = None
+        if data is not None:
+            # записи могут быть под запомненным отпечатком и под отпечатком
+            # текущего содержимого, если данные уже менялись на месте
+            fingerprints = {content_fingerprint(data)}
+            entry = _fingerprints.get(id(data))
+            if entry is not None and entry[0]() is data:
+                fingerprints.add(entry[2])
+            forget_fingerprint(data)
+        name = _function_name(func) if func is not None else None
+
+        for key in list(self.memory):
+            if (fingerprints is None or key[0] in fingerprints) and (
+                name is None or key[1] == name
+            ):
+                self.memory_bytes -= self.memory.pop(key)[1]
+
+        if self.disk_dir is not None:
+            for fingerprint in fingerprints or ["*"]:
+                for file in self.disk_dir.glob(f"{fingerprint}-{_file_name(name or '*')}-*.pkl"):
+                    file.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        self.invalidate()
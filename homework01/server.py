@@ -0,0 +1,282 @@
+"""
+HTTP/JSON-сервер с результатами задач 1–9.
+
+Датасет читается один раз при запуске. Расчеты выполняются в пуле процессов,
+запущенных через fork: рабочие процессы получают уже прочитанный датасет без
+копирования через pickle (на платформах без fork датасет копируется в каждый
+процесс один раз при его запуске), подвыборки по факультету и курсу запоминаются
+в каждом процессе. Для датасета и каждой подвыборки один раз строятся
+индексы StudentIndex (см. build_index), которыми пользуются задачи 1, 6, 7
+и 9. Одинаковые запросы, пришедшие одновременно, объединяются: считается
+один раз, ответ получают все ожидающие.
+
+Запросы:
+    GET /tasks/<номер>?faculty=...&course=...&length=5&prefix=П
+    GET /health
+
+faculty и course сужают датасет перед расчетом (для задач 1–3 faculty
+выбирает факультет вместо ФСУиР), length — длина серии номеров ИСУ в задаче 9,
+prefix — начало имени в задаче 7.
+
+Запуск: python server.py [путь_к_csv] [--port 8102] [--workers 4]
+"""
+import argparse
+import asyncio
+import json
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import lru_cache
+from typing import Any, Dict, Optional, Set, Tuple
+from urllib.parse import parse_qsl, unquote, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from cs102_pandas import (
+    FSUIR,
+    analyze_patronyms,
+    build_index,
+    course_statistics,
+    faculty_statistics,
+    filter_fsuir_students,
+    find_consecutive_students,
+    find_homonymous_students,
+    find_students_with_name_starting_P,
+    highest_avg_grade_faculty,
+    most_popular_name,
+)
+from parallel import fork_context
+
+PARAMETERS = {"faculty": str, "course": str, "length": int, "prefix": str}
+REASONS = {
+    200: "OK",
+    400: "Bad Request",
+    404: "Not Found",
+    405: "Method Not Allowed",
+    500: "Internal Server Error",
+}
+
+_data: Optional[pd.DataFrame] = None
+
+
+class EmptySubsetError(LookupError):
+    """
+    В выбранной подвыборке нет строк, по которым считается задача.
+    """
+
+
+def _init_worker(data: pd.DataFrame) -> None:
+    global _data
+    _data = data
+    _subset.cache_clear()
+    build_index(data)
+
+
+@lru_cache(maxsize=64)
+def _subset(faculty: Optional[str], course: Optional[str]) -> pd.DataFrame:
+    data = _data
+    if faculty is not None:
+        data = data[data["факультет"] == faculty]
+    if course is not None:
+        data = data[data["курс"] == course]
+    if data is not _data:
+        # подвыборка живет в кэше процесса и запрашивается повторно
+        build_index(data)
+    return data
+
+
+def to_jsonable(value: Any) -> Any:
+    """
+    Приводит результат задачи к типам JSON: таблицы — к списку записей,
+    серии — к словарю, скаляры NumPy — к числам Python.
+    """
+    if isinstance(value, pd.DataFrame):
+        return [
+            {str(column): to_jsonable(item) for column, item in row.items()}
+            for row in value.to_dict(orient="records")
+        ]
+    if isinstance(value, pd.Series):
+        return {str(key): to_jsonable(item) for key, item in value.items()}
+    if isinstance(value, (tuple, list)):
+        return [to_jsonable(item) for item in value]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    return value
+
+
+def run_task(task: int, params: Tuple[Tuple[str, Any], ...]) -> bytes:
+    """
+    Выполняется в рабочем процессе. Возвращает готовое тело ответа.
+    """
+    params = dict(params)
+    if task in (1, 2, 3):
+        data = _subset(None, params.get("course"))
+        fsuir = filter_fsuir_students(data, params.get("faculty", FSUIR))
+        if task != 1 and fsuir[0] == 0:
+            raise EmptySubsetError("no students of this faculty and course")
+        result = {
+            1: lambda: fsuir,
+            2: lambda: find_homonymous_students(fsuir[2]),
+            3: lambda: analyze_patronyms(fsuir[2]),
+        }[task]()
+    else:
+        data = _subset(params.get("faculty"), params.get("course"))
+        if data.empty:
+            raise EmptySubsetError("no students of this faculty and course")
+        if task == 8 and not (data["курс"] == "3-й").any():
+            raise EmptySubsetError("no 3rd-year students in this subset")
+        result = {
+            4: lambda: faculty_statistics(data),
+            5: lambda: course_statistics(data),
+            6: lambda: most_popular_name(data),
+            7: lambda: find_students_with_name_starting_P(data, prefix=params.get("prefix", "П")),
+            8: lambda: highest_avg_grade_faculty(data),
+            9: lambda: find_consecutive_students(data, params.get("length", 5)),
+        }[task]()
+    return json.dumps({"task": task, "result": to_jsonable(result)}, ensure_ascii=False).encode()
+
+
+class ReportServer:
+    """
+    Принимает HTTP-запросы и раздает расчеты пулу executor, объединяя одинаковые
+    запросы, которые еще выполняются. choices — допустимые значения параметров
+    (например, факультеты и курсы датасета, см. parameter_choices); запрос с другим
+    значением получает 404 без расчета.
+    """
+
+    def __init__(self, executor: Executor, choices: Optional[Dict[str, Set[str]]] = None):
+        self.executor = executor
+        self.choices = choices or {}
+        self.pending: Dict[tuple, asyncio.Future] = {}
+        self.stats = {"requests": 0, "computed": 0, "coalesced": 0}
+
+    async def compute(self, task: int, params: Tuple[Tuple[str, Any], ...]) -> bytes:
+        key = (task, params)
+        future = self.pending.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+        else:
+            self.stats["computed"] += 1
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self.executor, run_task, task, params)
+            self.pending[key] = future
+            future.add_done_callback(lambda _: self.pending.pop(key, None))
+        # отмена одного ожидающего клиента не должна отменять общий расчет
+        return await asyncio.shield(future)
+
+    async def respond(self, method: str, target: str) -> Tuple[int, bytes]:
+        if method != "GET":
+            return 405, b'{"error": "only GET is supported"}'
+        url = urlsplit(target)
+        path = unquote(url.path).rstrip("/")
+        if path == "/health":
+            return 200, json.dumps({"status": "ok", **self.stats}).encode()
+
+        parts = path.split("/")
+        if len(parts) != 3 or parts[1] != "tasks" or parts[2] not in map(str, range(1, 10)):
+            return 404, b'{"error": "use /tasks/<1-9>"}'
+        params = {}
+        for name, value in parse_qsl(url.query, keep_blank_values=True):
+            if name not in PARAMETERS:
+                return 400, json.dumps({"error": f"unknown parameter {name}"}).encode()
+            try:
+                params[name] = PARAMETERS[name](value)
+            except ValueError:
+                return 400, json.dumps({"error": f"bad value for {name}"}).encode()
+            if name in self.choices and params[name] not in self.choices[name]:
+                error = {"error": f"unknown {name}: {params[name]}"}
+                return 404, json.dumps(error, ensure_ascii=False).encode()
+        if params.get("length", 1) < 1:
+            return 400, b'{"error": "length must be positive"}'
+        try:
+            return 200, await self.compute(int(parts[2]), tuple(sorted(params.items())))
+        except EmptySubsetError as error:
+            return 404, json.dumps({"error": str(error)}).encode()
+        except Exception as error:
+            return 500, json.dumps({"error": repr(error)}, ensure_ascii=False).encode()
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                try:
+                    method, target, version = request_line.decode("latin-1").split()
+                except ValueError:
+                    break
+                if int(headers.get("content-length", 0)):
+                    await reader.readexactly(int(headers["content-length"]))
+
+                self.stats["requests"] += 1
+                status, body = await self.respond(method, target)
+                keep_alive = headers.get("connection", "").lower() != "close" and (
+                    version == "HTTP/1.1" or headers.get("connection", "").lower() == "keep-alive"
+                )
+                writer.write(
+                    (
+                        f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+                        "Content-Type: application/json; charset=utf-8\r\n"
+                        f"Content-Length: {len(body)}\r\n"
+                        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+                    ).encode("latin-1")
+                    + body
+                )
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def parameter_choices(data: pd.DataFrame) -> Dict[str, Set[str]]:
+    """
+    Факультеты и курсы датасета — допустимые значения параметров faculty и course.
+    """
+    return {
+        "faculty": set(data["факультет"].dropna()),
+        "course": set(data["курс"].dropna()),
+    }
+
+
+def make_executor(data: pd.DataFrame, workers: int) -> ProcessPoolExecutor:
+    """
+    Пул процессов, в каждом из которых датасет data доступен задачам run_task.
+    Процессы запускаются через fork, если он есть; иначе датасет передается
+    каждому процессу через pickle.
+    """
+    return ProcessPoolExecutor(
+        workers, mp_context=fork_context(), initializer=_init_worker, initargs=(data,)
+    )
+
+
+async def serve(data: pd.DataFrame, host: str, port: int, workers: int) -> None:
+    with make_executor(data, workers) as executor:
+        server = ReportServer(executor, parameter_choices(data))
+        listener = await asyncio.start_server(server.handle, host, port)
+        print(f"Сервер слушает http://{host}:{port}/tasks/<1-9>")
+        async with listener:
+            await listener.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", nargs="?", default="isu_fake_data.csv")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8102)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(pd.read_csv(args.path), args.host, args.port, args.workers))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,273 @@
+"""
+Потоковый отчет по задачам 1–9: CSV читается кусками по chunksize строк,
+и каждый кусок обновляет накопители задач.
+
+Накопители хранят только сводные данные: счетчики по факультетам, курсам,
+группам и именам, суммы и количества баллов, а также отрезки подряд идущих
+номеров ИСУ, которые сливаются через границы кусков. Отрезки после первой
+найденной серии нужной длины отбрасываются. Поэтому пиковая память
+определяется размером куска и числом различных значений, а не размером файла.
+Исключение — задачи 1–3: задача 1 возвращает саму подвыборку ФСУиР, поэтому
+она собирается целиком, и задачи 2 и 3 считаются по ней. Строки серии
+из задачи 9 выбираются вторым проходом по файлу.
+
+Запуск: python streaming.py [путь_к_csv] [--chunksize 100000] [--length 5]
+"""
+import argparse
+import tracemalloc
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List
+
+import numpy as np
+import pandas as pd
+
+from cs102_pandas import (
+    FSUIR,
+    analyze_patronyms,
+    course_statistics,
+    faculty_statistics,
+    filter_fsuir_students,
+    find_homonymous_students,
+    find_isu_runs,
+    genders_by_patronym,
+    parse_names,
+)
+from report import TASKS, print_report
+
+
+def merge_isu_intervals(
+    starts: np.ndarray, ends: np.ndarray, new_starts: np.ndarray, new_ends: np.ndarray
+) -> tuple:
+    """
+    Сливает два набора отрезков номеров [start, end], каждый из которых
+    отсортирован по началам, без повторной сортировки: новые отрезки
+    вставляются на свои места через searchsorted. Отрезки, которые
+    пересекаются или стыкуются, объединяются.
+    Возвращает отсортированные начала и концы непересекающихся отрезков.
+    """
+    size = starts.size + new_starts.size
+    is_new = np.zeros(size, dtype=bool)
+    is_new[np.searchsorted(starts, new_starts, side="right") + np.arange(new_starts.size)] = True
+    merged_starts = np.empty(size, dtype=np.int64)
+    merged_ends = np.empty(size, dtype=np.int64)
+    merged_starts[is_new], merged_starts[~is_new] = new_starts, starts
+    merged_ends[is_new], merged_ends[~is_new] = new_ends, ends
+    if size == 0:
+        return merged_starts, merged_ends
+    reach = np.maximum.accumulate(merged_ends)
+    first = np.flatnonzero(np.concatenate(([True], merged_starts[1:] > reach[:-1] + 1)))
+    return merged_starts[first], np.maximum.reduceat(merged_ends, first)
+
+
+class StreamingReport:
+    """
+    Накопители задач 1–9. update добавляет кусок датасета, merge — накопители,
+    собранные по другой части файла, result строит итоговый отчет.
+    length — длина серии номеров ИСУ в задаче 9.
+    """
+
+    def __init__(self, tasks: Iterable[int] = TASKS, length: int = 5):
+        self.tasks = list(tasks)
+        self.length = length
+        self.rows = 0
+        self.fsuir_chunks: List[pd.DataFrame] = []
+        self.faculty_counts: Counter = Counter()
+        self.course_faculty_counts: Counter = Counter()
+        self.name_counts: Counter = Counter()
+        self.name_group_counts: Counter = Counter()
+        self.group_info: Dict[str, tuple] = {}
+        self.p_name_rows: Dict[str, tuple] = {}
+        self.grade3_sums: Counter = Counter()
+        self.grade3_counts: Counter = Counter()
+        self.grade3_gender_sums: Counter = Counter()
+        self.grade3_gender_counts: Counter = Counter()
+        self.isu_starts = np.empty(0, dtype=np.int64)
+        self.isu_ends = np.empty(0, dtype=np.int64)
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        tasks = set(self.tasks)
+        self.rows += len(chunk)
+        if tasks & {1, 2, 3}:
+            self.fsuir_chunks.append(chunk[chunk["факультет"] == FSUIR])
+        if tasks & {4, 5}:
+            counts = chunk.groupby(["курс", "факультет"], sort=False).size()
+            self.course_faculty_counts.update(counts.to_dict())
+            self.faculty_counts.update(
+                counts.groupby(level="факультет", sort=False).sum().to_dict()
+            )
+        if tasks & {6, 7}:
+            self._update_names(chunk)
+        if 8 in tasks:
+            self._update_grades(chunk)
+        if 9 in tasks:
+            starts, lengths = find_isu_runs(chunk["ису"], length=1)
+            self._add_isu_intervals(starts, starts + lengths - 1)
+
+    def _add_isu_intervals(self, starts: np.ndarray, ends: np.ndarray) -> None:
+        starts, ends = merge_isu_intervals(self.isu_starts, self.isu_ends, starts, ends)
+        # отрезки, начинающиеся после первой уже найденной серии нужной длины,
+        # не могут дать серию раньше нее, поэтому не хранятся
+        long_enough = np.flatnonzero(ends - starts + 1 >= self.length)
+        if long_enough.size:
+            starts, ends = starts[: long_enough[0] + 1], ends[: long_enough[0] + 1]
+        self.isu_starts, self.isu_ends = starts, ends
+
+    def _update_names(self, chunk: pd.DataFrame) -> None:
+        names = parse_names(chunk)["имя"]
+        name_counts = names.value_counts(sort=False)
+        self.name_counts.update(name_counts[name_counts > 0].to_dict())
+        self.name_group_counts.update(
+            chunk.groupby([names, chunk["группа"]], observed=True, sort=False).size().to_dict()
+        )
+        for row in chunk.drop_duplicates("группа").itertuples(index=False):
+            self.group_info.setdefault(row.группа, (row.факультет, row.курс))
+
+        is_p = names.str.startswith("П", na=False).astype(bool)
+        chunk_p = chunk.loc[is_p, ["фио", "факультет", "курс"]]
+        chunk_p = chunk_p.assign(имя=names[is_p].astype(object))
+        for row in chunk_p.drop_duplicates("имя").itertuples():
+            self.p_name_rows.setdefault(row.имя, (row.Index, row.фио, row.факультет, row.курс))
+
+    def _update_grades(self, chunk: pd.DataFrame) -> None:
+        grade3 = chunk[chunk["курс"] == "3-й"]
+        grades = grade3.groupby("факультет", sort=False)["средний_балл"].agg(["sum", "count"])
+        self.grade3_sums.update(grades["sum"].to_dict())
+        self.grade3_counts.update(grades["count"].to_dict())
+
+        genders = genders_by_patronym(parse_names(chunk)["отчество"][grade3.index])
+        grade3 = grade3[genders != "unknown"]
+        grades = grade3.groupby(
+            ["факультет", genders[grade3.index]], sort=False, observed=True
+        )["средний_балл"].agg(["sum", "count"])
+        self.grade3_gender_sums.update(grades["sum"].to_dict())
+        self.grade3_gender_counts.update(grades["count"].to_dict())
+
+    def merge(self, other: "StreamingReport") -> None:
+        self.rows += other.rows
+        self.fsuir_chunks.extend(other.fsuir_chunks)
+        for name in [
+            "faculty_counts",
+            "course_faculty_counts",
+            "name_counts",
+            "name_group_counts",
+            "grade3_sums",
+            "grade3_counts",
+            "grade3_gender_sums",
+            "grade3_gender_counts",
+        ]:
+            getattr(self, name).update(getattr(other, name))
+        for group, info in other.group_info.items():
+            self.group_info.setdefault(group, info)
+        for name, row in other.p_name_rows.items():
+            self.p_name_rows.setdefault(name, row)
+        self._add_isu_intervals(other.isu_starts, other.isu_ends)
+
+    def result(self, read_chunks: Callable[[], Iterable[pd.DataFrame]]) -> Dict[int, Any]:
+        """
+        Строит отчет с теми же значениями, что и report.build_report.
+        read_chunks должна заново открывать источник: строки серии задачи 9
+        выбираются повторным проходом.
+        """
+        report: Dict[int, Any] = {}
+        if set(self.tasks) & {1, 2, 3}:
+            fsuir = filter_fsuir_students(pd.concat(self.fsuir_chunks))
+        for task in self.tasks:
+            if task == 1:
+                report[1] = fsuir
+            elif task == 2:
+                report[2] = find_homonymous_students(fsuir[2])
+            elif task == 3:
+                report[3] = analyze_patronyms(fsuir[2])
+            elif task == 4:
+                report[4] = faculty_statistics(None, pd.Series(self.faculty_counts))
+            elif task == 5:
+                counts = pd.Series(self.course_faculty_counts)
+                counts.index.names = ["курс", "факультет"]
+                report[5] = course_statistics(None, counts)
+            elif task == 6:
+                report[6] = self._most_popular_name()
+            elif task == 7:
+                report[7] = self._names_starting_P()
+            elif task == 8:
+                report[8] = self._highest_avg_grade_faculty()
+            elif task == 9:
+                report[9] = self._consecutive_students(read_chunks)
+        return report
+
+    def _most_popular_name(self) -> tuple:
+        name_counts = pd.Series(self.name_counts).sort_values(ascending=False, kind="stable")
+        popular_name = name_counts.idxmax()
+        group_counts = pd.Series(
+            {group: n for (name, group), n in self.name_group_counts.items() if name == popular_name}
+        ).sort_values(ascending=False, kind="stable")
+        name_group = group_counts.idxmax()
+        faculty, course = self.group_info[name_group]
+        name_ratio = round(name_counts.max() / self.rows, 2)
+        return (popular_name, name_group, faculty, course, name_ratio)
+
+    def _names_starting_P(self) -> pd.DataFrame:
+        rows = [row for name, row in self.p_name_rows.items() if self.name_counts[name] == 1]
+        index, *columns = zip(*rows) if rows else ((), (), (), ())
+        result = pd.DataFrame(
+            {
+                name: pd.Series(values, dtype=object)
+                for name, values in zip(["фио", "факультет", "курс"], columns)
+            }
+        )
+        # индекс задается отдельно, чтобы и пустой результат был int64, как в pandas
+        result.index = pd.Index(index, dtype=np.int64)
+        return result.sort_index()
+
+    def _highest_avg_grade_faculty(self) -> tuple:
+        faculty_means = pd.Series(self.grade3_sums) / pd.Series(self.grade3_counts)
+        fac = faculty_means.idxmax()
+        gender_means = {
+            gender: total / self.grade3_gender_counts[(faculty, gender)]
+            for (faculty, gender), total in self.grade3_gender_sums.items()
+            if faculty == fac
+        }
+        avg_gender = pd.Series(gender_means, dtype=float)
+        return (fac, avg_gender.idxmax(), round(avg_gender.max()))
+
+    def _consecutive_students(
+        self, read_chunks: Callable[[], Iterable[pd.DataFrame]]
+    ) -> pd.DataFrame:
+        length = self.length
+        columns = ["фио", "ису", "факультет", "курс", "группа"]
+        lengths = self.isu_ends - self.isu_starts + 1
+        long_enough = np.flatnonzero(lengths >= length)
+        sequence = (
+            self.isu_starts[long_enough[0]] + np.arange(length) if long_enough.size else []
+        )
+        found = [chunk.loc[chunk["ису"].isin(sequence), columns] for chunk in read_chunks()]
+        return pd.concat(found).sort_values(by="ису")
+
+
+def stream_report(
+    path: str, chunksize: int = 100_000, tasks: Iterable[int] = TASKS, length: int = 5
+) -> Dict[int, Any]:
+    """
+    Строит отчет по CSV-файлу, читая его кусками по chunksize строк.
+    length — длина серии номеров ИСУ в задаче 9.
+    """
+
+    def read_chunks() -> Iterable[pd.DataFrame]:
+        return pd.read_csv(path, chunksize=chunksize)
+
+    accumulators = StreamingReport(tasks, length)
+    for chunk in read_chunks():
+        accumulators.update(chunk)
+    return accumulators.result(read_chunks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("path", nargs="?", default="isu_fake_data.csv")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--length", type=int, default=5, help="длина серии номеров ИСУ (задача 9)")
+    args = parser.parse_args()
+
+    tracemalloc.start()
+    print_report(stream_report(args.path, args.chunksize, length=args.length))
+    _, peak = tracemalloc.get_traced_memory()
+    print(f"Пиковая память: {peak / 2**20:.1f} МБ")
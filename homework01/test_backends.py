@@ -0,0 +1,116 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+import test_cs102_pandas
+from backends import BACKENDS, QueryBackend, available_backends, get_backend
+from cs102_pandas import (
+    filter_fsuir_students, faculty_statistics, course_statistics, most_popular_name,
+    highest_avg_grade_faculty, find_consecutive_students
+)
+from test_report import assert_same_result
+
+SOURCE = "isu_fake_data.csv"
+# проверки берутся из словаря класса, чтобы сам TestDataAnalysis не запускался здесь повторно
+CHECKS = vars(test_cs102_pandas.TestDataAnalysis)
+TASK_FUNCTIONS = [
+    filter_fsuir_students, faculty_statistics, course_statistics, most_popular_name,
+    highest_avg_grade_faculty, find_consecutive_students,
+]
+
+
+class BackendConformance:
+    """
+    Проверки из test_cs102_pandas для задач 1, 4, 5, 6, 8 и 9, в которых функции
+    cs102_pandas заменены на методы бэкенда, читающего тот же CSV.
+    """
+
+    backend_name = None
+
+    @classmethod
+    def setUpClass(cls):
+        if cls.backend_name not in available_backends():
+            raise unittest.SkipTest(f"бэкенд {cls.backend_name} не установлен")
+        cls.backend = get_backend(cls.backend_name)
+        cls.data = pd.read_csv(SOURCE)
+
+    def setUp(self):
+        replacements = {
+            func.__name__: (
+                lambda data, *args, name=func.__name__, **kwargs: getattr(self.backend, name)(
+                    SOURCE, *args, **kwargs
+                )
+            )
+            for func in TASK_FUNCTIONS
+        }
+        patcher = mock.patch.multiple(test_cs102_pandas, **replacements)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    test_filter_fsuir_students = CHECKS["test_filter_fsuir_students"]
+    test_faculty_statistics = CHECKS["test_faculty_statistics"]
+    test_course_statistics = CHECKS["test_course_statistics"]
+    test_most_popular_name = CHECKS["test_most_popular_name"]
+    test_highest_avg_grade_faculty = CHECKS["test_highest_avg_grade_faculty"]
+    test_find_consecutive_students = CHECKS["test_find_consecutive_students"]
+    test_find_consecutive_students_length = CHECKS["test_find_consecutive_students_length"]
+
+    def test_same_results_as_pandas(self):
+        for func in TASK_FUNCTIONS:
+            with self.subTest(task=func.__name__):
+                assert_same_result(func(self.data), getattr(self.backend, func.__name__)(SOURCE))
+
+
+class TestPandasBackend(BackendConformance, unittest.TestCase):
+    backend_name = "pandas"
+
+
+class TestDuckDBBackend(BackendConformance, unittest.TestCase):
+    backend_name = "duckdb"
+
+    def test_parquet_and_frame_sources(self):
+        frame = self.data.iloc[:3000]
+        with tempfile.TemporaryDirectory() as directory:
+            parquet = os.path.join(directory, "students.parquet")
+            self.backend.connection.execute(
+                f"COPY (SELECT * FROM read_csv('{SOURCE}', header = true)) TO '{parquet}'"
+            )
+            for func in TASK_FUNCTIONS:
+                with self.subTest(task=func.__name__):
+                    method = getattr(self.backend, func.__name__)
+                    assert_same_result(func(frame), method(frame))
+                    assert_same_result(func(self.data), method(parquet))
+
+
+class TestPolarsBackend(BackendConformance, unittest.TestCase):
+    backend_name = "polars"
+
+    def test_frame_sources(self):
+        frame = self.data.iloc[:3000]
+        categorical = self.data.astype({"факультет": "category", "курс": "category"})
+        for func in TASK_FUNCTIONS:
+            with self.subTest(task=func.__name__):
+                method = getattr(self.backend, func.__name__)
+                assert_same_result(func(frame), method(frame))
+                assert_same_result(func(self.data), method(categorical))
+
+
+class TestBackendRegistry(unittest.TestCase):
+    def test_registry(self):
+        self.assertIn("pandas", available_backends())
+        self.assertTrue(set(available_backends()) <= set(BACKENDS))
+        with self.assertRaises(ValueError):
+            get_backend("spark")
+
+    def test_incomplete_backend(self):
+        class CountsOnly(QueryBackend):
+            def faculty_counts(self, source):
+                return pd.Series(dtype=int)
+
+        with self.assertRaises(TypeError):
+            CountsOnly()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+import os
+import shutil
+import tempfile
+import unittest
+import pandas as pd
+from cs102_pandas import parse_names
+from columnar import is_cache_fresh, load_dataset
+from report import build_report
+from test_report import assert_same_result
+
+
+def without_categories(result):
+    if isinstance(result, tuple):
+        return tuple(without_categories(item) for item in result)
+    if isinstance(result, (pd.DataFrame, pd.Series)):
+        result = result.copy()
+        result.index = result.index.astype(object)
+        return result.astype(object)
+    return result
+
+
+class TestColumnar(unittest.TestCase):
+    def setUp(self):
+        self.folder = tempfile.mkdtemp()
+        self.path = os.path.join(self.folder, "isu_fake_data.csv")
+        shutil.copy("isu_fake_data.csv", self.path)
+
+    def tearDown(self):
+        shutil.rmtree(self.folder)
+
+    def test_load_dataset_types_and_values(self):
+        data = load_dataset(self.path)
+        self.assertEqual(data["курс"].dtype, "category")
+        self.assertEqual(data["факультет"].dtype, "category")
+        self.assertEqual(data["ису"].dtype, "int32")
+        self.assertEqual(data["средний_балл"].dtype, "float32")
+        source = pd.read_csv(self.path)
+        for column in source.columns:
+            self.assertEqual(data[column].astype(source[column].dtype).tolist(), source[column].tolist())
+        self.assertEqual(parse_names(data).loc[0].tolist(), ["Шнейдерис", "Пётр", "Константинович"])
+
+    def test_report_on_cached_dataset(self):
+        expected = build_report(pd.read_csv(self.path))
+        report = build_report(load_dataset(self.path))
+        for task, result in expected.items():
+            with self.subTest(task=task):
+                assert_same_result(without_categories(result), without_categories(report[task]))
+
+    def test_missing_isu(self):
+        source = pd.read_csv(self.path)
+        source.loc[[3, 10], "ису"] = None
+        source.to_csv(self.path, index=False)
+        data = load_dataset(self.path)
+        self.assertEqual(data["ису"].dtype, "float64")
+        self.assertEqual(data["ису"].isna().tolist(), source["ису"].isna().tolist())
+        self.assertTrue(data["ису"].dropna().equals(source["ису"].dropna()))
+        self.assertEqual(data["ису"].min(), source["ису"].min())
+
+    def test_cache_invalidation(self):
+        load_dataset(self.path)
+        self.assertTrue(is_cache_fresh(self.path))
+
+        stat = os.stat(self.path)
+        os.utime(self.path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        self.assertTrue(is_cache_fresh(self.path))
+
+        with open(self.path, "a", encoding="utf-8") as source:
+            source.write("школа разработки видеоигр,J3102,1-й,999999,Новиков Пётр Ильич,90\n")
+        self.assertFalse(is_cache_fresh(self.path))
+        data = load_dataset(self.path)
+        self.assertEqual(len(data), 7470)
+        self.assertEqual(int(data["ису"].iloc[-1]), 999999)
+
+
+if __name__ == "__main__":
+    unittest.main()
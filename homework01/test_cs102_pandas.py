@@ -1,9 +1,12 @@
 import unittest
 import pandas as pd
+from compact import memory_report, optimize_dtypes
 from cs102_pandas import (
     filter_fsuir_students, find_homonymous_students, analyze_patronyms,
     faculty_statistics, course_statistics, most_popular_name,
-    find_students_with_name_starting_P, highest_avg_grade_faculty, find_consecutive_students
+    find_students_with_name_starting_P, highest_avg_grade_faculty, find_consecutive_students,
+    find_isu_runs, parse_names, gender_identification, genders_by_patronym, build_index,
+    find_homonyms, namesake_counts, normalize_surnames
 )
 
 class TestDataAnalysis(unittest.TestCase):
@@ -30,11 +33,44 @@ class TestDataAnalysis(unittest.TestCase):
         self.assertEqual(homonyms_per_course.loc["4-й"], 94)
         self.assertEqual(max_homonym_group, "R33441c")
     
+    def test_find_homonyms(self):
+        homonyms = find_homonyms(self.data, ["факультет", "курс"])
+        self.assertEqual(list(homonyms.columns), ["факультет", "курс", "фамилия", "количество"])
+        self.assertTrue((homonyms["количество"] > 1).all())
+        fsuir = homonyms[homonyms["факультет"] == "факультет систем управления и робототехники"]
+        self.assertEqual(fsuir.groupby("курс", observed=True)["количество"].sum().tolist(), [111, 111, 134, 94])
+
+        counts = namesake_counts(self.data, ["группа"])
+        self.assertEqual((counts > 1).sum(), find_homonyms(self.data, ["группа"])["количество"].sum())
+        self.assertGreater(
+            find_homonyms(self.data, normalize_gender=True)["количество"].sum(),
+            find_homonyms(self.data)["количество"].sum(),
+        )
+
+        with_missing = pd.DataFrame({
+            "фио": ["Иванов Иван", None, None, "Петров Петр", "Иванов Петр"],
+            "курс": ["1-й"] * 5,
+            "группа": ["M3100"] * 5,
+            "факультет": ["ф"] * 5,
+        })
+        self.assertEqual(namesake_counts(with_missing).tolist(), [2, 0, 0, 1, 2])
+        self.assertEqual(find_homonymous_students(with_missing)[1], 2)
+        self.assertEqual(find_homonyms(with_missing)["количество"].sum(), 2)
+
+    def test_normalize_surnames(self):
+        surnames = pd.Series(["Иванова", "Иванов", "Достоевская", "Соловьёва", "Ильина", "Дюма", None])
+        normalized = normalize_surnames(surnames)
+        self.assertEqual(
+            normalized[:-1].tolist(), ["Иванов", "Иванов", "Достоевский", "Соловьёв", "Ильин", "Дюма"]
+        )
+        self.assertTrue(pd.isna(normalized.iloc[-1]))
+
     def test_analyze_patronyms(self):
         _, _, fsuir = filter_fsuir_students(self.data)
         students_without_patronym, gender_counts = analyze_patronyms(fsuir)
         self.assertEqual(students_without_patronym, 409)
-        self.assertEqual(gender_counts["male"], 384)
+        # двое студентов ФСУиР с тюркскими отчествами на "оглы"
+        self.assertEqual(gender_counts["male"], 386)
         self.assertEqual(gender_counts["female"], 155)
     
     def test_faculty_statistics(self):
@@ -96,6 +132,103 @@ class TestDataAnalysis(unittest.TestCase):
                                                      "M34041" if isu == 311124 else "N34461")
             self.assertEqual(student_data["курс"].iloc[0], "4-й")
 
+    def test_parse_names(self):
+        names = parse_names(self.data)
+        self.assertIs(parse_names(self.data), names)
+        self.assertEqual(names.loc[0].tolist(), ["Шнейдерис", "Пётр", "Константинович"])
+        self.assertEqual(int(names["отчество"].isna().sum()), 995)
+        self.assertEqual(names["имя"].dtype, "category")
+
+        turkic = pd.DataFrame({"фио": ["Степанов Эльвин Тарлан Оглы", "Алиева Айсель Джовдат кызы"]})
+        self.assertEqual(parse_names(turkic)["отчество"].tolist(), ["Тарлан Оглы", "Джовдат кызы"])
+        self.assertEqual(analyze_patronyms(turkic)[1].tolist(), [1, 1])
+
+    def test_cache_follows_replaced_columns(self):
+        data = self.data.copy()
+        parse_names(data)
+        data["фио"] = "Иванов Яков Петрович"
+        self.assertEqual(most_popular_name(data)[0], "Яков")
+
+    def test_tasks_do_not_mutate_input(self):
+        data = self.data.copy()
+        columns = list(data.columns)
+        _, _, fsuir = filter_fsuir_students(data)
+        fsuir_columns = list(fsuir.columns)
+        find_homonymous_students(fsuir)
+        analyze_patronyms(fsuir)
+        most_popular_name(data)
+        find_students_with_name_starting_P(data)
+        highest_avg_grade_faculty(data)
+        self.assertEqual(list(data.columns), columns)
+        self.assertEqual(list(fsuir.columns), fsuir_columns)
+
+    def test_gender_identification(self):
+        self.assertEqual(gender_identification("Константинович"), "male")
+        self.assertEqual(gender_identification("Ильинична"), "female")
+        self.assertEqual(gender_identification("Тарлан Оглы"), "male")
+        self.assertEqual(gender_identification("Джовдат кызы"), "female")
+        self.assertEqual(gender_identification("Мамдух"), "unknown")
+        self.assertEqual(gender_identification(""), "unknown")
+        self.assertEqual(gender_identification(None), "unknown")
+
+    def test_genders_by_patronym_matches_scalar(self):
+        patronyms = pd.concat(
+            [parse_names(self.data)["отчество"].astype(object), pd.Series(["Тарлан Оглы", "Азизжон Кизи", ""])],
+            ignore_index=True,
+        )
+        genders = genders_by_patronym(patronyms)
+        self.assertEqual(genders.tolist(), [gender_identification(p) for p in patronyms])
+
+    def test_build_index(self):
+        data = self.data.copy()
+        index = build_index(data)
+        self.assertIs(build_index(data), index)
+        self.assertTrue(index.has_isu(311121))
+        self.assertFalse(index.has_isu(1))
+        self.assertEqual(len(index.faculty_rows["факультет систем управления и робототехники"]), 993)
+        self.assertTrue(all(name.startswith("П") for name in index.names_with_prefix("П")))
+
+        plain = self.data.copy()
+        self.assertEqual(filter_fsuir_students(data)[:2], filter_fsuir_students(plain)[:2])
+        self.assertEqual(most_popular_name(data), most_popular_name(plain))
+        self.assertTrue(find_students_with_name_starting_P(data).equals(find_students_with_name_starting_P(plain)))
+        self.assertTrue(find_consecutive_students(data).equals(find_consecutive_students(plain)))
+
+        data["факультет"] = "x"
+        self.assertEqual(filter_fsuir_students(data)[0], 0)
+        self.assertIsNot(build_index(data), index)
+
+    def test_find_isu_runs(self):
+        starts, lengths = find_isu_runs([7, 1, 2, 3, 3, 10, 11, 12, 13, 14, 15, 5], length=3)
+        self.assertEqual(starts.tolist(), [1, 10])
+        self.assertEqual(lengths.tolist(), [3, 6])
+        starts, lengths = find_isu_runs([7, 1, 2, 3, 3, 10, 11, 12, 13, 14, 15, 5], length=3, limit=1)
+        self.assertEqual(starts.tolist(), [1])
+        starts, _ = find_isu_runs([1, 3, 5], length=2)
+        self.assertEqual(starts.size, 0)
+
+    def test_find_consecutive_students_length(self):
+        result = find_consecutive_students(self.data, length=7)
+        self.assertEqual(result["ису"].nunique(), 7)
+        self.assertTrue(all(result["ису"].drop_duplicates().diff().dropna() == 1))
+        self.assertTrue(find_consecutive_students(self.data, length=10**6).empty)
+
+
+class TestDataAnalysisOptimized(TestDataAnalysis):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.original = cls.data
+        cls.data = optimize_dtypes(cls.data)
+
+    def test_optimized_dtypes(self):
+        self.assertEqual(self.data["факультет"].dtype, "category")
+        self.assertEqual(self.data["курс"].dtype, "category")
+        self.assertEqual(self.data["ису"].dtype, "int32")
+        self.assertEqual(self.data["средний_балл"].dtype, "int8")
+        report = memory_report(self.original, self.data)
+        self.assertLess(report.loc["всего", "байт_после"], report.loc["всего", "байт_до"])
+
 
 if __name__ == "__main__":
     unittest.main()
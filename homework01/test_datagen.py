@@ -0,0 +1,35 @@
+import unittest
+import pandas as pd
+from cs102_pandas import genders_by_patronym, parse_names
+from datagen import FACULTIES, generate_students
+from report import build_report
+
+
+class TestDatagen(unittest.TestCase):
+    def test_columns_match_fixture(self):
+        data = generate_students(1000)
+        fixture = pd.read_csv("isu_fake_data.csv", nrows=5)
+        self.assertEqual(len(data), 1000)
+        self.assertEqual(sorted(data.columns), sorted(fixture.columns))
+        self.assertTrue(set(data["факультет"]) <= set(FACULTIES))
+        self.assertTrue(data["средний_балл"].between(60, 100).all())
+
+    def test_deterministic(self):
+        pd.testing.assert_frame_equal(generate_students(500, seed=3), generate_students(500, seed=3))
+        self.assertFalse(generate_students(500, seed=3).equals(generate_students(500, seed=4)))
+
+    def test_patronyms(self):
+        data = generate_students(5000, no_patronym_share=0.1, turkic_share=0.05)
+        genders = genders_by_patronym(parse_names(data)["отчество"])
+        # тюркские отчества на "оглы"/"кызы" распознаются, unknown — только без отчества
+        self.assertAlmostEqual((genders == "unknown").mean(), 0.10, delta=0.03)
+        self.assertTrue(data["фио"].str.contains(" (?:оглы|кызы)$").any())
+
+    def test_report_runs(self):
+        report = build_report(generate_students(20000, isu_density=0.9))
+        self.assertEqual(sorted(report), list(range(1, 10)))
+        self.assertEqual(len(report[9]), 5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import unittest
+import pandas as pd
+from cs102_pandas import (
+    filter_fsuir_students, find_homonymous_students, analyze_patronyms,
+    faculty_statistics, course_statistics, most_popular_name,
+    find_students_with_name_starting_P, highest_avg_grade_faculty, find_consecutive_students
+)
+from incremental import IncrementalReport, IsuIntervals
+from test_report import assert_same_result
+
+
+def serial_results(data):
+    _, _, fsuir = filter_fsuir_students(data)
+    return {
+        1: filter_fsuir_students(data),
+        2: find_homonymous_students(fsuir),
+        3: analyze_patronyms(fsuir),
+        4: faculty_statistics(data),
+        5: course_statistics(data),
+        6: most_popular_name(data),
+        7: find_students_with_name_starting_P(data),
+        8: highest_avg_grade_faculty(data),
+        9: find_consecutive_students(data),
+    }
+
+
+def incremental_results(report):
+    return {
+        1: report.filter_fsuir_students(),
+        2: report.find_homonymous_students(),
+        3: report.analyze_patronyms(),
+        4: report.faculty_statistics(),
+        5: report.course_statistics(),
+        6: report.most_popular_name(),
+        7: report.find_students_with_name_starting_P(),
+        8: report.highest_avg_grade_faculty(),
+        9: report.find_consecutive_students(),
+    }
+
+
+class TestIncremental(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pd.read_csv("isu_fake_data.csv")
+
+    def assert_matches(self, data, report):
+        expected, actual = serial_results(data), incremental_results(report)
+        for task in expected:
+            with self.subTest(task=task):
+                assert_same_result(expected[task], actual[task])
+
+    def test_seeded_state(self):
+        self.assert_matches(self.data, IncrementalReport(self.data))
+
+    def test_add_remove_update(self):
+        base = self.data.iloc[:6000]
+        report = IncrementalReport(base)
+
+        added = self.data.iloc[6000:6500]
+        report.add_students(added)
+        removed = base.index[::7]
+        report.remove_students(removed)
+        updated = self.data.iloc[6500:6800].copy()
+        kept = base.index.difference(removed)
+        updated.index = kept[1:1200:4]
+        report.update_students(updated)
+
+        data = pd.concat([base, added]).drop(removed)
+        data.loc[updated.index] = updated
+        self.assert_matches(data, report)
+
+        with self.assertRaises(ValueError):
+            report.add_students(added.iloc[:1])
+        with self.assertRaises(KeyError):
+            report.remove_students(removed[:1])
+
+    def test_missing_isu(self):
+        data = self.data.copy()
+        data.loc[[0, 100, 2000], "ису"] = None
+        report = IncrementalReport(data.iloc[:5000])
+        report.add_students(data.iloc[5000:])
+        report.remove_students([100])
+        self.assert_matches(data.drop(100), report)
+
+    def test_missing_names(self):
+        data = self.data.copy()
+        fsuir = data.index[data["факультет"] == "факультет систем управления и робототехники"]
+        data.loc[fsuir[:3], "фио"] = None
+        data.loc[data.index[-50:], "фио"] = None
+        report = IncrementalReport(data.iloc[:5000])
+        report.add_students(data.iloc[5000:])
+        report.remove_students(fsuir[:1])
+        self.assert_matches(data.drop(fsuir[:1]), report)
+
+    def test_isu_intervals(self):
+        intervals = IsuIntervals()
+        for isu in [5, 1, 3, 2, 2, 4, 10]:
+            intervals.add(isu)
+        self.assertEqual((intervals.starts, intervals.ends), ([1, 10], [5, 10]))
+        intervals.remove(3)
+        intervals.remove(2)
+        self.assertEqual((intervals.starts, intervals.ends), ([1, 4, 10], [2, 5, 10]))
+        intervals.remove(2)
+        self.assertEqual(intervals.first_run(2), range(4, 6))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from unittest import mock
+import pandas as pd
+import parallel
+from parallel import faculty_aggregates
+from report import SharedAggregates, build_report
+from test_report import assert_same_result
+
+
+class TestParallel(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pd.read_csv("isu_fake_data.csv")
+
+    def test_parallel_report_matches_serial(self):
+        expected = build_report(self.data, tasks=[4, 5, 8])
+        for workers in [1, 3]:
+            report = build_report(self.data, tasks=[4, 5, 8], workers=workers)
+            for task, result in expected.items():
+                with self.subTest(workers=workers, task=task):
+                    assert_same_result(result, report[task])
+
+    def test_same_order_as_serial(self):
+        serial = SharedAggregates(self.data)
+        aggregates = faculty_aggregates(self.data, workers=3)
+        for name in ["faculty_counts", "course_faculty_counts", "grade3_faculty_means"]:
+            with self.subTest(name=name):
+                expected = getattr(serial, name)
+                self.assertTrue(getattr(aggregates, name).index.equals(expected.index))
+                assert_same_result(expected, getattr(aggregates, name))
+
+        self.assertTrue(faculty_aggregates(self.data.iloc[:0], workers=2).faculty_counts.empty)
+
+    def test_without_fork(self):
+        expected = faculty_aggregates(self.data, workers=2)
+        with mock.patch("parallel.fork_context", return_value=None):
+            serial = faculty_aggregates(self.data, workers=2)
+        for name, result in expected._asdict().items():
+            with self.subTest(name=name):
+                assert_same_result(result, getattr(serial, name))
+
+    def test_aggregate_rows(self):
+        data = pd.DataFrame({
+            "курс": ["1-й", "3-й", "3-й", "1-й"],
+            "факультет": ["а", "б", "б", "а"],
+            "средний_балл": [70.0, 80.0, None, 90.0],
+        })
+        parallel._init_worker({name: data[name] for name in parallel.COLUMNS})
+        part = parallel._aggregate_rows(1, 4)
+        self.assertEqual(part.index.tolist(), [("3-й", "б"), ("1-й", "а")])
+        self.assertEqual(part.values.tolist(), [[2, 80.0, 1], [1, 90.0, 1]])
+
+
+if __name__ == "__main__":
+    unittest.main()
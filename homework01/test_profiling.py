@@ -0,0 +1,78 @@
+import json
+import os
+import tempfile
+import unittest
+import pandas as pd
+from pandas.core.generic import NDFrame
+from cs102_pandas import faculty_statistics, filter_fsuir_students
+from profiling import profiled, profiling
+from report import build_report
+from test_report import assert_same_result
+
+
+class TestProfiling(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pd.read_csv("isu_fake_data.csv")
+
+    def test_records_every_task(self):
+        expected = build_report(self.data.copy(deep=False))
+        with profiling() as profiler:
+            report = build_report(self.data.copy(deep=False))
+        for task in range(1, 10):
+            assert_same_result(expected[task], report[task])
+        summary = profiler.summary()
+        self.assertEqual(list(summary), list(range(1, 10)))
+        self.assertEqual(summary[1]["function"], "filter_fsuir_students")
+        self.assertEqual(summary[1]["rows_scanned"], len(self.data))
+        for task, total in summary.items():
+            with self.subTest(task=task):
+                self.assertEqual(total["calls"], 1)
+                self.assertGreater(total["wall_seconds"], 0)
+                self.assertGreater(total["peak_bytes"], 0)
+                self.assertGreater(total["frames_created"] + total["series_created"], 0)
+
+    def test_disabled_records_nothing(self):
+        original_init = NDFrame.__init__
+        with profiling(memory=False) as profiler:
+            faculty_statistics(self.data)
+        filter_fsuir_students(self.data)
+        self.assertIs(NDFrame.__init__, original_init)
+        self.assertEqual([record["task"] for record in profiler.records], [4])
+        self.assertIsNone(profiler.records[0]["peak_bytes"])
+
+    def test_nested_calls(self):
+        @profiled(100)
+        def outer(data):
+            return faculty_statistics(data)
+
+        with profiling() as profiler:
+            outer(self.data)
+        inner, outer_record = profiler.records
+        self.assertEqual((inner["task"], outer_record["task"]), (4, 100))
+        self.assertGreaterEqual(outer_record["wall_seconds"], inner["wall_seconds"])
+        self.assertGreaterEqual(outer_record["peak_bytes"], inner["peak_bytes"])
+        self.assertGreaterEqual(outer_record["series_created"], inner["series_created"])
+
+    def test_not_reentrant(self):
+        with profiling(memory=False):
+            with self.assertRaises(RuntimeError):
+                with profiling():
+                    pass
+
+    def test_dumps(self):
+        with tempfile.TemporaryDirectory() as directory:
+            json_path = os.path.join(directory, "profile.json")
+            cprofile_path = os.path.join(directory, "report.prof")
+            with profiling(cprofile_path=cprofile_path) as profiler:
+                build_report(self.data, tasks=[4, 9])
+            profiler.dump_json(json_path)
+            with open(json_path, encoding="utf-8") as file:
+                dump = json.load(file)
+            self.assertEqual(sorted(dump["tasks"]), ["4", "9"])
+            self.assertEqual(len(dump["calls"]), 2)
+            self.assertGreater(os.path.getsize(cprofile_path), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+import pandas as pd
+from pandas.testing import assert_frame_equal, assert_series_equal
+from cs102_pandas import (
+    filter_fsuir_students, find_homonymous_students, analyze_patronyms,
+    faculty_statistics, course_statistics, most_popular_name,
+    find_students_with_name_starting_P, highest_avg_grade_faculty, find_consecutive_students
+)
+from report import build_report
+
+
+def assert_same_result(expected, actual):
+    if isinstance(expected, tuple):
+        assert len(expected) == len(actual)
+        for expected_item, actual_item in zip(expected, actual):
+            assert_same_result(expected_item, actual_item)
+    elif isinstance(expected, pd.DataFrame):
+        assert_frame_equal(expected, actual, check_dtype=False)
+    elif isinstance(expected, pd.Series):
+        assert_series_equal(expected, actual, check_dtype=False, check_names=False)
+    else:
+        assert expected == actual, (expected, actual)
+
+
+class TestReport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pd.read_csv("isu_fake_data.csv")
+
+    def test_build_report_matches_task_functions(self):
+        report = build_report(self.data)
+        _, _, fsuir = filter_fsuir_students(self.data)
+        expected = {
+            1: filter_fsuir_students(self.data),
+            2: find_homonymous_students(fsuir),
+            3: analyze_patronyms(fsuir),
+            4: faculty_statistics(self.data),
+            5: course_statistics(self.data),
+            6: most_popular_name(self.data),
+            7: find_students_with_name_starting_P(self.data),
+            8: highest_avg_grade_faculty(self.data),
+            9: find_consecutive_students(self.data),
+        }
+        self.assertEqual(list(report), list(expected))
+        for task, result in expected.items():
+            with self.subTest(task=task):
+                assert_same_result(result, report[task])
+
+        indexed = build_report(self.data.copy(), index=True)
+        for task, result in expected.items():
+            with self.subTest(task=task, index=True):
+                assert_same_result(result, indexed[task])
+
+    def test_build_report_selected_tasks(self):
+        report = build_report(self.data, tasks=[4, 8])
+        self.assertEqual(list(report), [4, 8])
+        self.assertEqual(report[4][1], ("факультет программной инженерии и компьютерной техники", 2154))
+        self.assertEqual(report[8], ("физический факультет", "female", 86))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+from cs102_pandas import course_statistics, faculty_statistics, find_homonyms, most_popular_name
+from result_cache import ResultCache, dataset_fingerprint
+from test_report import assert_same_result
+
+
+class TestResultCache(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pd.read_csv("isu_fake_data.csv")
+
+    def test_repeat_calls_hit_cache(self):
+        cache = ResultCache()
+        for func in [most_popular_name, course_statistics, faculty_statistics]:
+            with self.subTest(func=func.__name__):
+                expected = func(self.data)
+                assert_same_result(expected, cache.call(func, self.data))
+                assert_same_result(expected, cache.call(func, self.data))
+        self.assertEqual(cache.stats, {"hits": 3, "disk_hits": 0, "misses": 3})
+
+    def test_unhashable_arguments(self):
+        cache = ResultCache()
+        expected = find_homonyms(self.data, ["факультет", "курс"])
+        assert_same_result(expected, cache.call(find_homonyms, self.data, ["факультет", "курс"]))
+        assert_same_result(expected, cache.call(find_homonyms, self.data, ["факультет", "курс"]))
+        cache.call(find_homonyms, self.data, ["курс"])
+        self.assertEqual(cache.stats["hits"], 1)
+        self.assertEqual(cache.stats["misses"], 2)
+        self.assertEqual(
+            cache._key(len, self.data, ({"b": [1], "a": {2, 3}},), {}),
+            cache._key(len, self.data, ({"a": {3, 2}, "b": [1]},), {}),
+        )
+
+    def test_fingerprint_is_content_based(self):
+        data = self.data.copy()
+        self.assertEqual(dataset_fingerprint(data), dataset_fingerprint(self.data))
+        data["средний_балл"] = data["средний_балл"] + 1
+        self.assertNotEqual(dataset_fingerprint(data), dataset_fingerprint(self.data))
+
+    def test_results_are_copies(self):
+        cache = ResultCache()
+        counts = cache.call(faculty_statistics, self.data)[0]
+        counts.loc[0, "количество"] = -1
+        self.assertGreater(cache.call(faculty_statistics, self.data)[0].loc[0, "количество"], 0)
+
+    def test_column_replacement_detected(self):
+        cache = ResultCache()
+        data = self.data.copy()
+        cache.call(faculty_statistics, data)
+        data["факультет"] = "один факультет"
+        counts, max_faculty, _ = cache.call(faculty_statistics, data)
+        self.assertEqual(max_faculty, ("один факультет", len(data)))
+        self.assertEqual(cache.stats["misses"], 2)
+
+    def test_in_place_writes_need_invalidation(self):
+        data = self.data.copy()
+        cache = ResultCache()
+        cache.call(faculty_statistics, data)
+        data.loc[:, "факультет"] = "один факультет"
+        cache.invalidate(data)
+        self.assertEqual(cache.call(faculty_statistics, data)[1], ("один факультет", len(data)))
+
+        verified = ResultCache(verify=True)
+        verified.call(faculty_statistics, data)
+        data.loc[data.index[0], "факультет"] = "другой факультет"
+        self.assertEqual(len(verified.call(faculty_statistics, data)[0]), 2)
+
+    def test_mutating_function(self):
+        def add_column(data):
+            data["флаг"] = 1
+            return len(data.columns)
+
+        cache = ResultCache()
+        data = self.data.copy()
+        before = dataset_fingerprint(data)
+        self.assertEqual(cache.call(add_column, data), len(self.data.columns) + 1)
+        self.assertNotEqual(dataset_fingerprint(data), before)
+        self.assertEqual(cache.call(add_column, self.data.copy()), len(self.data.columns) + 1)
+        self.assertEqual(cache.stats["hits"], 1)
+
+    def test_eviction_and_invalidation(self):
+        cache = ResultCache(max_bytes=4_000)
+        cache.call(course_statistics, self.data)
+        cache.call(faculty_statistics, self.data)
+        cache.call(most_popular_name, self.data)
+        self.assertLessEqual(cache.memory_bytes, 4_000)
+        self.assertLess(len(cache.memory), 3)
+        cache.invalidate(func=most_popular_name)
+        self.assertTrue(all("most_popular_name" not in key[1] for key in cache.memory))
+        cache.clear()
+        self.assertEqual((len(cache.memory), cache.memory_bytes), (0, 0))
+
+    def test_disk_tier(self):
+        with tempfile.TemporaryDirectory() as directory:
+            ResultCache(disk_dir=directory).call(course_statistics, self.data)
+            cache = ResultCache(disk_dir=directory)
+            assert_same_result(
+                course_statistics(self.data), cache.call(course_statistics, self.data.copy())
+            )
+            self.assertEqual(cache.stats["disk_hits"], 1)
+            cache.invalidate(self.data)
+            self.assertEqual(os.listdir(directory), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
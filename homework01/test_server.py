@@ -0,0 +1,99 @@
+import asyncio
+import json
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import quote
+import pandas as pd
+import server
+from cs102_pandas import (
+    faculty_statistics,
+    filter_fsuir_students,
+    find_consecutive_students,
+    find_students_with_name_starting_P,
+)
+from load_test import request
+from server import ReportServer, make_executor, parameter_choices, run_task, to_jsonable
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pd.read_csv("isu_fake_data.csv")
+        server._init_worker(cls.data)
+
+    async def asyncSetUp(self):
+        self.executor = ThreadPoolExecutor(2)
+        self.server = ReportServer(self.executor, parameter_choices(self.data))
+
+    async def asyncTearDown(self):
+        self.executor.shutdown()
+
+    def test_run_task(self):
+        result = json.loads(run_task(4, ()))
+        counts = faculty_statistics(self.data)[0]
+        self.assertEqual(result["task"], 4)
+        self.assertEqual(result["result"][0], to_jsonable(counts))
+        self.assertEqual(result["result"][1][1], 2154)
+
+        physics = "физический факультет"
+        result = json.loads(run_task(1, (("faculty", physics),)))["result"]
+        self.assertEqual(result[:2], list(filter_fsuir_students(self.data, physics)[:2]))
+
+        result = json.loads(run_task(9, (("length", 3),)))["result"]
+        self.assertEqual(result, to_jsonable(find_consecutive_students(self.data, 3)))
+
+        result = json.loads(run_task(7, (("course", "2-й"), ("prefix", "А"))))["result"]
+        expected = find_students_with_name_starting_P(
+            self.data[self.data["курс"] == "2-й"], prefix="А"
+        )
+        self.assertEqual(result, to_jsonable(expected))
+
+    async def test_coalescing(self):
+        results = await asyncio.gather(*(self.server.compute(5, ()) for _ in range(10)))
+        self.assertEqual(len(set(results)), 1)
+        self.assertEqual(self.server.stats["computed"], 1)
+        self.assertEqual(self.server.stats["coalesced"], 9)
+        self.assertEqual(self.server.pending, {})
+
+        await self.server.compute(5, ())
+        self.assertEqual(self.server.stats["computed"], 2)
+
+    async def test_process_pool(self):
+        # рабочие процессы должны считать по датасету из initializer
+        data = self.data.iloc[:2000]
+        with make_executor(data, 2) as executor:
+            report_server = ReportServer(executor)
+            result = json.loads(await report_server.compute(4, (("course", "1-й"),)))
+        counts = faculty_statistics(data[data["курс"] == "1-й"])[0]
+        self.assertEqual(result["result"][0], to_jsonable(counts))
+
+    async def test_http(self):
+        listener = await asyncio.start_server(self.server.handle, "127.0.0.1", 0)
+        port = listener.sockets[0].getsockname()[1]
+        async with listener:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            paths = {
+                "/tasks/8": 200,
+                "/tasks/2?faculty=" + quote("физический факультет"): 200,
+                "/tasks/10": 404,
+                "/tasks/9?length=five": 400,
+                "/tasks/9?limit=5": 400,
+                "/tasks/9?length=0": 400,
+                "/tasks/4?faculty=" + quote("нет такого"): 404,
+                "/tasks/4?course=" + quote("7-й"): 404,
+                "/tasks/8?course=" + quote("1-й"): 404,
+                "/tasks/8?faculty=" + quote("школа разработки видеоигр"): 404,
+                "/tasks/6?faculty=" + quote("школа разработки видеоигр") + "&course=" + quote("2-й"): 404,
+                "/tasks/2?faculty=" + quote("школа разработки видеоигр") + "&course=" + quote("2-й"): 404,
+                "/tasks/2?faculty=" + quote("физический факультет") + "&course=" + quote("1-й"): 200,
+                "/health": 200,
+            }
+            for path, expected in paths.items():
+                with self.subTest(path=path):
+                    self.assertEqual(await request(reader, writer, "127.0.0.1", path), expected)
+            writer.close()
+            await writer.wait_closed()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import numpy as np
+import pandas as pd
+from pandas.testing import assert_frame_equal
+from cs102_pandas import find_consecutive_students, find_students_with_name_starting_P
+from report import build_report
+from streaming import StreamingReport, merge_isu_intervals, stream_report
+from test_report import assert_same_result
+
+
+class TestStreaming(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.data = pd.read_csv("isu_fake_data.csv")
+        cls.expected = build_report(cls.data)
+
+    def test_stream_report_matches_build_report(self):
+        for chunksize in [1000, 3333, 10**6]:
+            report = stream_report("isu_fake_data.csv", chunksize=chunksize)
+            for task, result in self.expected.items():
+                with self.subTest(chunksize=chunksize, task=task):
+                    assert_same_result(result, report[task])
+
+    def test_merge_accumulators(self):
+        halves = [self.data.iloc[:4000], self.data.iloc[4000:]]
+        accumulators = []
+        for half in halves:
+            accumulator = StreamingReport(tasks=[4, 6, 8, 9])
+            accumulator.update(half)
+            accumulators.append(accumulator)
+        accumulators[0].merge(accumulators[1])
+        report = accumulators[0].result(lambda: halves)
+        for task in [4, 6, 8, 9]:
+            with self.subTest(task=task):
+                assert_same_result(self.expected[task], report[task])
+
+    def test_run_length_and_empty_results(self):
+        report = stream_report("isu_fake_data.csv", chunksize=2000, tasks=[9], length=3)
+        assert_same_result(find_consecutive_students(self.data, 3), report[9])
+
+        no_p_names = self.data.iloc[1:3]
+        accumulator = StreamingReport(tasks=[7])
+        accumulator.update(no_p_names)
+        result = accumulator.result(lambda: [no_p_names])[7]
+        assert_frame_equal(find_students_with_name_starting_P(no_p_names), result)
+
+    def test_merge_isu_intervals(self):
+        starts, ends = merge_isu_intervals(
+            np.array([1, 10, 20]), np.array([3, 12, 20]), np.array([4, 15]), np.array([8, 19])
+        )
+        self.assertEqual(starts.tolist(), [1, 10, 15])
+        self.assertEqual(ends.tolist(), [8, 12, 20])
+
+    def test_isu_intervals_after_run_are_dropped(self):
+        accumulator = StreamingReport(tasks=[9], length=3)
+        accumulator.update(pd.DataFrame({"ису": [100, 1, 50, 51, 52, 53, 7]}))
+        self.assertEqual(accumulator.isu_starts.tolist(), [1, 7, 50])
+        accumulator.update(pd.DataFrame({"ису": [8, 9, 200, 201, 202]}))
+        self.assertEqual(accumulator.isu_starts.tolist(), [1, 7])
+        self.assertEqual(accumulator.isu_ends.tolist(), [1, 9])
+
+
+if __name__ == "__main__":
+    unittest.main()